@@ -1269,6 +1269,11 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     coordinator = RaySharpNVRCoordinator(hass, client, entry)
     await coordinator.async_config_entry_first_refresh()
+    # Lookup tables only seed caches that fall back to per-event lookups, so
+    # they must not hold up setup
+    entry.async_create_background_task(
+        hass, coordinator.async_prefetch_lookups(), "raysharp_nvr_prefetch_lookups"
+    )
 
     hass.data.setdefault(DOMAIN, {})[entry.entry_id] = coordinator
 
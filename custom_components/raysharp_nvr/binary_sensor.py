@@ -35,7 +35,6 @@ from .const import (
     ALARM_TYPE_VEHICLE,
     ALARM_TYPE_WANDER,
     CONF_EVENT_TIMEOUT,
-    DATA_CHANNEL_INFO,
     DATA_DEVICE_INFO,
     DATA_DISARMING,
     DEFAULT_EVENT_TIMEOUT,
@@ -75,24 +74,6 @@ NVR_BINARY_SENSORS: tuple[RaySharpBinarySensorDescription, ...] = (
 )
 
 
-def _get_channel_list(data: dict[str, Any]) -> list[dict[str, Any]]:
-    """Extract channel list from coordinator data."""
-    channel_data = data.get(DATA_CHANNEL_INFO)
-    if not channel_data:
-        return []
-    if isinstance(channel_data, dict):
-        channels = channel_data.get("channel_param", {}).get("items", [])
-        if not channels:
-            channels = channel_data.get("channels", channel_data.get("channel", []))
-    elif isinstance(channel_data, list):
-        channels = channel_data
-    else:
-        return []
-    if not isinstance(channels, list):
-        channels = [channels]
-    return channels
-
-
 # (alarm_type, key_suffix, translation_key, device_class)
 EVENT_BINARY_SENSOR_TYPES: list[tuple[str, str, str, BinarySensorDeviceClass]] = [
     (ALARM_TYPE_MOTION, "motion_detected", "motion_detected", BinarySensorDeviceClass.MOTION),
@@ -129,8 +110,7 @@ async def async_setup_entry(
         entities.append(RaySharpBinarySensor(coordinator, description))
 
     # Channel sensors
-    channels = _get_channel_list(coordinator.data)
-    for i, channel in enumerate(channels):
+    for i, channel in enumerate(coordinator.channels):
         channel_num = channel_num_from_str(channel.get("channel", ""), i + 1)
         channel_name = channel.get("channel_name", f"Channel {channel_num}")
 
@@ -142,7 +122,9 @@ async def async_setup_entry(
                     key=f"channel_{channel_num}_online",
                     translation_key="channel_online",
                     device_class=BinarySensorDeviceClass.CONNECTIVITY,
-                    value_fn=lambda data, idx=i: _is_channel_online(data, idx),
+                    value_fn=lambda data, idx=i: _is_channel_online(
+                        coordinator.channels, idx
+                    ),
                 ),
                 channel_num=channel_num,
                 channel_name=channel_name,
@@ -155,7 +137,9 @@ async def async_setup_entry(
                     key=f"channel_{channel_num}_videoloss",
                     translation_key="channel_videoloss",
                     device_class=BinarySensorDeviceClass.PROBLEM,
-                    value_fn=lambda data, idx=i: _is_channel_videoloss(data, idx),
+                    value_fn=lambda data, idx=i: _is_channel_videoloss(
+                        coordinator.channels, idx
+                    ),
                 ),
                 channel_num=channel_num,
                 channel_name=channel_name,
@@ -190,18 +174,18 @@ async def async_setup_entry(
     async_add_entities(entities)
 
 
-def _is_channel_online(data: dict[str, Any], index: int) -> bool | None:
+def _is_channel_online(channels: list[dict[str, Any]], index: int) -> bool | None:
     """Check if a channel is online."""
-    channels = _get_channel_list(data)
     if index < len(channels):
         status = str(channels[index].get("connect_status", "")).lower()
         return status == "online"
     return None
 
 
-def _is_channel_videoloss(data: dict[str, Any], index: int) -> bool | None:
+def _is_channel_videoloss(
+    channels: list[dict[str, Any]], index: int
+) -> bool | None:
     """Check if a channel has video loss."""
-    channels = _get_channel_list(data)
     if index < len(channels):
         videoloss = channels[index].get("videoloss")
         if videoloss is None:
@@ -304,7 +288,9 @@ class RaySharpEventBinarySensor(RaySharpChannelEntity, BinarySensorEntity):
         # explicitly turned off in the NVR config. The entity still exists
         # and users can manually enable it; it becomes active if the NVR
         # config is changed and the integration is reloaded.
-        enabled_on_nvr = _get_detection_enabled(coordinator.data, channel_num, alarm_type)
+        enabled_on_nvr = _get_detection_enabled(
+            coordinator.data, channel_num, alarm_type, self._ch_key
+        )
         self._attr_entity_registry_enabled_default = enabled_on_nvr is not False
 
     @property
@@ -9,29 +9,11 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import DATA_CHANNEL_INFO, DATA_DEVICE_INFO, DATA_RTSP_URLS, DOMAIN
+from .const import DATA_DEVICE_INFO, DATA_RTSP_URLS, DOMAIN
 from .coordinator import RaySharpNVRCoordinator
 from .entity import RaySharpChannelEntity, channel_num_from_str
 
 
-def _get_channel_list(data: dict[str, Any]) -> list[dict[str, Any]]:
-    """Extract channel list from coordinator data."""
-    channel_data = data.get(DATA_CHANNEL_INFO)
-    if not channel_data:
-        return []
-    if isinstance(channel_data, dict):
-        channels = channel_data.get("channel_param", {}).get("items", [])
-        if not channels:
-            channels = channel_data.get("channels", channel_data.get("channel", []))
-    elif isinstance(channel_data, list):
-        channels = channel_data
-    else:
-        return []
-    if not isinstance(channels, list):
-        channels = [channels]
-    return channels
-
-
 def _get_rtsp_urls(data: dict[str, Any]) -> dict[int, str]:
     """Extract RTSP URLs mapped by channel index (0-based)."""
     rtsp_data = data.get(DATA_RTSP_URLS)
@@ -96,7 +78,7 @@ async def async_setup_entry(
     """Set up RaySharp NVR cameras."""
     coordinator: RaySharpNVRCoordinator = hass.data[DOMAIN][entry.entry_id]
 
-    channels = _get_channel_list(coordinator.data)
+    channels = coordinator.channels
     rtsp_urls = _get_rtsp_urls(coordinator.data)
 
     entities: list[RaySharpCamera] = []
@@ -150,7 +132,7 @@ class RaySharpCamera(RaySharpChannelEntity, Camera):
     @property
     def is_streaming(self) -> bool:
         """Return whether the camera is streaming."""
-        for channel in _get_channel_list(self.coordinator.data):
+        for channel in self.coordinator.channels:
             ch_num = channel_num_from_str(channel.get("channel", ""), 0)
             if ch_num == self._channel_num:
                 return str(channel.get("connect_status", "")).lower() == "online"
@@ -290,10 +290,12 @@ STORAGE_VERSION = 1
 STORAGE_KEEP_DAYS = 30   # keep entries for 30 days
 STORAGE_SAVE_DELAY = 60  # debounce: save at most every 60 s
 DOMAIN_TRACKERS = "raysharp_nvr_trackers"  # hass.data key for tracker refs
+DOMAIN_SNAPSHOT_DISPATCH = "raysharp_nvr_snapshot_dispatch"  # hass.data key
+DOMAIN_SNAPSHOT_SAVE = "raysharp_nvr_snapshot_save"  # hass.data key
 
 # ─── Snapshot History ──────────────────────────────────────────────────────────
 API_AI_VHD_GET = "/API/AI/VhdLog/GetByIndex"  # person/vehicle image search
-STORAGE_KEY_SNAPSHOTS_PREFIX = "raysharp_nvr_snap"  # suffix: _{channel}_{type}
+STORAGE_KEY_SNAPSHOTS_PREFIX = "raysharp_nvr_snap"  # suffix: _{channel}
 CONF_SNAPSHOT_HISTORY_COUNT = "snapshot_history_count"
 DEFAULT_SNAPSHOT_HISTORY_COUNT = 5
 
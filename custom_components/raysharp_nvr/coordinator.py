@@ -9,8 +9,9 @@ import time
 from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryAuthFailed
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from .api_client import (
@@ -19,9 +20,11 @@ from .api_client import (
     RaySharpNVRConnectionError,
 )
 from .const import (
+    API_AI_ADDED_PLATES_GET,
     API_AI_CC_STATS,
     API_AI_CROSS_COUNTING,
     API_AI_FACES,
+    API_AI_FD_GROUPS,
     API_AI_FD_SETUP,
     API_AI_FACE_STATS,
     API_AI_HEATMAP_STATS,
@@ -137,6 +140,105 @@ AI_SETUP_ENDPOINTS: dict[str, str] = {
 _CHANNEL_CONFIG_PARAMS: dict[str, str] = {"page_type": "ChannelConfig"}
 
 
+def _parse_channel_list(data: dict[str, Any]) -> list[dict[str, Any]]:
+    """Extract channel list from coordinator data.
+
+    Runs on every poll, so malformed payloads yield empty channels rather
+    than failing the refresh.
+    """
+    channel_data = data.get(DATA_CHANNEL_INFO)
+    if not channel_data:
+        return []
+    # JSON decoding yields exact dict/list instances, so check the concrete
+    # type first and only fall back to isinstance() for subclasses.
+    t = type(channel_data)
+    if t is not dict and t is not list:
+        if isinstance(channel_data, dict):
+            t = dict
+        elif isinstance(channel_data, list):
+            t = list
+        else:
+            return []
+    if t is dict:
+        param = channel_data.get("channel_param")
+        channels = param.get("items", []) if isinstance(param, dict) else []
+        if not channels:
+            channels = channel_data.get("channels", channel_data.get("channel", []))
+    else:
+        channels = channel_data
+    if type(channels) is not list and not isinstance(channels, list):
+        # Single-channel devices may return one channel object, not a list
+        channels = [channels]
+    # Callers index channels by position and read them with .get(), so keep
+    # the numbering but replace anything that is not a dict
+    if all(type(ch) is dict for ch in channels):
+        return channels
+    return [ch if isinstance(ch, dict) else {} for ch in channels]
+
+
+_MB_TO_GB = 1 / 1024
+
+
+def _parse_disk_list(data: dict[str, Any]) -> list[dict[str, Any]]:
+    """Extract the disk list from coordinator data."""
+    disk_data = data.get(DATA_DISK_CONFIG)
+    if not disk_data:
+        return []
+    if isinstance(disk_data, dict):
+        disk_list = disk_data.get("disk_info", disk_data.get("disks", disk_data.get("disk", [])))
+    elif isinstance(disk_data, list):
+        disk_list = disk_data
+    else:
+        return []
+    if not isinstance(disk_list, list):
+        disk_list = [disk_list]
+    # Parsed on every poll, so a malformed item must not fail the refresh
+    return [disk for disk in disk_list if isinstance(disk, dict)]
+
+
+def _disk_sizes_gb(disk: dict[str, Any]) -> dict[str, float | None]:
+    """Convert a disk's MB sizes to the GB values exposed by the sensors.
+
+    Sizes that are not numbers are reported as unknown.
+    """
+    total_mb = disk.get("total_size")
+    if not isinstance(total_mb, (int, float)):
+        total_mb = None
+    free_mb = disk.get("free_size")
+    if not isinstance(free_mb, (int, float)):
+        free_mb = None
+    return {
+        "total_space": (
+            round(total_mb * _MB_TO_GB, 1) if total_mb is not None else None
+        ),
+        "free_space": round(free_mb * _MB_TO_GB, 1) if free_mb is not None else None,
+        "used_space": (
+            round((total_mb - free_mb) * _MB_TO_GB, 1)
+            if total_mb is not None and free_mb is not None
+            else None
+        ),
+    }
+
+
+def _channel_alarm_value(alarm_data: Any, ch_key: str, field: str) -> bool | None:
+    """Get a boolean alarm field value for a specific channel.
+
+    Alarm configs use "CH{n}" keys in channel_info dict.
+    """
+    if not isinstance(alarm_data, dict):
+        return None
+    channel_info = alarm_data.get("channel_info", {})
+    if not isinstance(channel_info, dict):
+        return None
+    ch_data = channel_info.get(ch_key, {})
+    if not isinstance(ch_data, dict):
+        return None
+    value = ch_data.get(field)
+    if value is None:
+        return None
+    return bool(value)
+
+
 class RaySharpNVRCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     """Coordinator for polling all RaySharp NVR data."""
 
@@ -166,6 +268,28 @@ class RaySharpNVRCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         # Key: (channel, alarm_type) → monotonic timestamp of last dispatch.
         self._alarm_debounce: dict[tuple[int, str], float] = {}
         self._alarm_debounce_window: float = 10.0  # seconds
+        # Per-channel alarm config lookups for the current self.data object;
+        # cleared whenever the coordinator publishes a new data dict.
+        self._channel_alarm_cache: dict[tuple[str, str, str], bool | None] = {}
+        self._channel_alarm_cache_data: dict[str, Any] | None = None
+        # Channel list parsed from DATA_CHANNEL_INFO once per poll
+        self.channels: list[dict[str, Any]] = []
+        # Disk list and each disk's GB sizes, parsed and converted once per poll
+        self.disks: list[dict[str, Any]] = []
+        self.disk_sizes_gb: list[dict[str, float | None]] = []
+        # Face groups and plate database records fetched once at setup, so
+        # trackers can resolve detections without a lookup per event
+        self.face_groups: dict[Any, dict[str, Any]] = {}
+        self.known_plates: list[dict[str, Any]] = []
+        # Refreshes requested after config writes; trails the last request so
+        # a script toggling many switches triggers a single poll.
+        self._config_refresh_debouncer = Debouncer(
+            hass,
+            _LOGGER,
+            cooldown=1.0,
+            immediate=False,
+            function=self.async_refresh,
+        )
 
     async def _async_update_data(self) -> dict[str, Any]:
         """Fetch all data from the NVR."""
@@ -269,8 +393,97 @@ class RaySharpNVRCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             else:
                 data[key] = self._extract_data(result)
 
+        self.channels = _parse_channel_list(data)
+        self.disks = _parse_disk_list(data)
+        self.disk_sizes_gb = [_disk_sizes_gb(disk) for disk in self.disks]
         return data
 
+    async def async_prefetch_lookups(self) -> None:
+        """Fetch face groups and known plates concurrently (best effort)."""
+        groups_resp, plates_resp = await asyncio.gather(
+            self.client.async_api_call(API_AI_FD_GROUPS, {}),
+            self.client.async_api_call(API_AI_ADDED_PLATES_GET, {"PlatesId": []}),
+            return_exceptions=True,
+        )
+        if isinstance(groups_resp, BaseException):
+            _LOGGER.debug("Face groups not available: %s", groups_resp)
+        elif isinstance(data := self._extract_data(groups_resp), dict):
+            groups = data.get("group_info", data.get("groups", data.get("items", [])))
+            if isinstance(groups, list):
+                self.face_groups = {
+                    g.get("group_id", g.get("id")): g
+                    for g in groups
+                    if isinstance(g, dict)
+                }
+        if isinstance(plates_resp, BaseException):
+            _LOGGER.debug("Plate database not available: %s", plates_resp)
+        elif isinstance(data := self._extract_data(plates_resp), dict):
+            plate_list = data.get("PlateInfo", []) or []
+            if isinstance(plate_list, list):
+                self.known_plates = [
+                    info for info in plate_list if isinstance(info, dict)
+                ]
+
+    def get_channel_alarm(
+        self, data_key: str, ch_key: str, field: str
+    ) -> bool | None:
+        """Return a channel's boolean alarm config field, cached per update."""
+        data = self.data
+        cache = self._channel_alarm_cache
+        if data is not self._channel_alarm_cache_data:
+            cache.clear()
+            self._channel_alarm_cache_data = data
+        key = (data_key, ch_key, field)
+        try:
+            return cache[key]
+        except KeyError:
+            pass
+        value = cache[key] = _channel_alarm_value(data.get(data_key), ch_key, field)
+        return value
+
+    @callback
+    def async_set_local_data(self, data_key: str, value: Any) -> None:
+        """Optimistically replace one data section after a successful write.
+
+        Publishes a new top-level dict (so identity-keyed caches reset) and
+        notifies listeners without polling the NVR.
+        """
+        self.data = {**self.data, data_key: value}
+        self.async_update_listeners()
+
+    @callback
+    def async_set_local_channel_field(
+        self, data_key: str, ch_key: str, field: str, value: Any
+    ) -> None:
+        """Optimistically update one field of a channel's config section."""
+        section = self.data.get(data_key)
+        if not isinstance(section, dict):
+            return
+        channel_info = section.get("channel_info", {})
+        if not isinstance(channel_info, dict):
+            return
+        ch_data = channel_info.get(ch_key, {})
+        if not isinstance(ch_data, dict):
+            # Leave an unexpected shape alone; the caller's refresh re-reads it
+            return
+        # Copy along the path instead of mutating the polled payload in place
+        self.async_set_local_data(
+            data_key,
+            {
+                **section,
+                "channel_info": {**channel_info, ch_key: {**ch_data, field: value}},
+            },
+        )
+
+    async def async_request_refresh_debounced(self) -> None:
+        """Request a refresh that coalesces with other recent requests."""
+        await self._config_refresh_debouncer.async_call()
+
+    async def async_shutdown(self) -> None:
+        """Cancel any pending debounced refresh and shut down."""
+        self._config_refresh_debouncer.async_shutdown()
+        await super().async_shutdown()
+
     @staticmethod
     def _extract_data(response: dict[str, Any]) -> Any:
         """Extract data payload from API response envelope."""
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import sys
 from typing import Any
 
 from homeassistant.helpers.device_registry import DeviceInfo
@@ -11,7 +12,6 @@ from .const import (
     ALARM_TYPE_FACE,
     ALARM_TYPE_INTRUSION,
     ALARM_TYPE_LINE_CROSSING,
-    ALARM_TYPE_MOTION,
     ALARM_TYPE_PERSON,
     ALARM_TYPE_PLATE,
     ALARM_TYPE_VEHICLE,
@@ -27,8 +27,39 @@ from .const import (
 from .coordinator import RaySharpNVRCoordinator
 
 
+# Setup data keys probed, in order, to resolve whether a detection type is
+# enabled on a channel.  Plates fall back to the FD setup on firmware without
+# a dedicated LPD endpoint.  Motion (and any unlisted type) resolves to None.
+_ALARM_PROBES: dict[str, tuple[str, ...]] = {
+    ALARM_TYPE_PERSON: (DATA_AI_PVD_SETUP,),
+    ALARM_TYPE_VEHICLE: (DATA_AI_PVD_SETUP,),
+    ALARM_TYPE_FACE: (DATA_AI_FD_SETUP,),
+    ALARM_TYPE_PLATE: (DATA_AI_LPD_SETUP, DATA_AI_FD_SETUP),
+    ALARM_TYPE_LINE_CROSSING: (DATA_AI_LCD_SETUP,),
+    ALARM_TYPE_INTRUSION: (DATA_AI_INTRUSION_SETUP,),
+}
+
+
+def _probe_ch_switch(data: dict[str, Any], data_key: str, ch_key: str) -> bool | None:
+    """Return the per-channel "switch" value from a setup payload, if present."""
+    setup = data.get(data_key)
+    if not isinstance(setup, dict):
+        return None
+    ch_info = setup.get("channel_info", {})
+    if not isinstance(ch_info, dict):
+        return None
+    ch = ch_info.get(ch_key, {})
+    if not isinstance(ch, dict):
+        return None
+    switch = ch.get("switch")
+    return bool(switch) if switch is not None else None
+
+
 def _get_detection_enabled(
-    data: dict[str, Any], channel_num: int, alarm_type: str
+    data: dict[str, Any],
+    channel_num: int,
+    alarm_type: str,
+    ch_key: str | None = None,
 ) -> bool | None:
     """Check if an alarm/detection type is enabled on the NVR for a channel.
 
@@ -39,35 +70,15 @@ def _get_detection_enabled(
 
     NVR setup data structure (FD/PVD/LCD/Intrusion):
         {"channel_info": {"CH17": {"switch": true/false, ...}}}
+
+    Callers that already hold the "CH{n}" key may pass it as *ch_key*.
     """
-    ch_key = f"CH{channel_num}"
-
-    def _ch_switch(data_key: str) -> bool | None:
-        setup = data.get(data_key)
-        if not isinstance(setup, dict):
-            return None
-        ch_info = setup.get("channel_info", {})
-        if not isinstance(ch_info, dict):
-            return None
-        ch = ch_info.get(ch_key, {})
-        if not isinstance(ch, dict):
-            return None
-        switch = ch.get("switch")
-        return bool(switch) if switch is not None else None
-
-    if alarm_type in (ALARM_TYPE_PERSON, ALARM_TYPE_VEHICLE):
-        return _ch_switch(DATA_AI_PVD_SETUP)
-    if alarm_type == ALARM_TYPE_MOTION:
-        return None
-    if alarm_type == ALARM_TYPE_FACE:
-        return _ch_switch(DATA_AI_FD_SETUP)
-    if alarm_type == ALARM_TYPE_PLATE:
-        lpd = _ch_switch(DATA_AI_LPD_SETUP)
-        return lpd if lpd is not None else _ch_switch(DATA_AI_FD_SETUP)
-    if alarm_type == ALARM_TYPE_LINE_CROSSING:
-        return _ch_switch(DATA_AI_LCD_SETUP)
-    if alarm_type == ALARM_TYPE_INTRUSION:
-        return _ch_switch(DATA_AI_INTRUSION_SETUP)
+    if ch_key is None:
+        ch_key = f"CH{channel_num}"
+    for data_key in _ALARM_PROBES.get(alarm_type, ()):
+        value = _probe_ch_switch(data, data_key, ch_key)
+        if value is not None:
+            return value
     return None
 
 
@@ -88,28 +99,33 @@ def channel_num_from_str(ch_str: str, fallback: int) -> int:
 class RaySharpEntity(CoordinatorEntity[RaySharpNVRCoordinator]):
     """Base class for RaySharp NVR-level entities."""
 
+    # HA base classes keep a __dict__; slots here only cover our own attributes
+    __slots__ = ("_device_info_data", "_nvr_device_info")
+
     _attr_has_entity_name = True
 
     def __init__(self, coordinator: RaySharpNVRCoordinator) -> None:
         """Initialize the entity."""
         super().__init__(coordinator)
         self._device_info_data = coordinator.data.get(DATA_DEVICE_INFO, {}) or {}
+        self._nvr_device_info: DeviceInfo | None = None
 
     @property
     def device_info(self) -> DeviceInfo:
-        """Return NVR device info."""
-        device_data = self.coordinator.data.get(DATA_DEVICE_INFO, {}) or {}
-        mac = device_data.get("mac_addr", "unknown")
-        model = device_data.get("device_type", "NVR")
-        fw_version = device_data.get("http_api_version")
-
-        return DeviceInfo(
-            identifiers={(DOMAIN, mac)},
-            name=f"RaySharp {model}",
-            manufacturer=MANUFACTURER,
-            model=model,
-            sw_version=fw_version,
-        )
+        """Return NVR device info (built once, on first access)."""
+        if self._nvr_device_info is None:
+            device_data = self.coordinator.data.get(DATA_DEVICE_INFO, {}) or {}
+            mac = device_data.get("mac_addr", "unknown")
+            model = device_data.get("device_type", "NVR")
+            fw_version = device_data.get("http_api_version")
+            self._nvr_device_info = DeviceInfo(
+                identifiers=frozenset(((DOMAIN, mac),)),
+                name=f"RaySharp {model}",
+                manufacturer=MANUFACTURER,
+                model=model,
+                sw_version=fw_version,
+            )
+        return self._nvr_device_info
 
 
 class RaySharpChannelEntity(RaySharpEntity):
@@ -119,6 +135,14 @@ class RaySharpChannelEntity(RaySharpEntity):
     Entity names then appear as "CH17 CAM03 – Person Detected" etc.
     """
 
+    __slots__ = (
+        "_channel_num",
+        "_channel_name",
+        "_ch_key",
+        "_ch_identifier_suffix",
+        "_ch_identifiers",
+    )
+
     def __init__(
         self,
         coordinator: RaySharpNVRCoordinator,
@@ -129,37 +153,49 @@ class RaySharpChannelEntity(RaySharpEntity):
         super().__init__(coordinator)
         self._channel_num = channel_num
         self._channel_name = channel_name
+        # Interned: used as a dict key on every per-channel config lookup
+        self._ch_key = sys.intern(f"CH{channel_num}")
+        self._ch_identifier_suffix = f"_ch{channel_num}"
+        mac = self._device_info_data.get("mac_addr", "unknown")
+        # Shared across every DeviceInfo this entity builds; never mutated
+        self._ch_identifiers = frozenset(
+            ((DOMAIN, f"{mac}{self._ch_identifier_suffix}"),)
+        )
 
     @property
     def device_info(self) -> DeviceInfo:
-        """Return per-channel device info linked to the NVR.
-
-        For channel_num == 0 (NVR-level entities), returns the NVR device
-        itself so those entities appear under the main NVR device, not under
-        a phantom "CH0" device.
-        """
+        """Return per-channel device info linked to the NVR."""
         nvr_data = self.coordinator.data.get(DATA_DEVICE_INFO, {}) or {}
         mac = nvr_data.get("mac_addr", "unknown")
-        if self._channel_num == 0:
-            model = nvr_data.get("device_type", "NVR")
-            fw_version = nvr_data.get("http_api_version")
-            return DeviceInfo(
-                identifiers={(DOMAIN, mac)},
-                name=f"RaySharp {model}",
-                manufacturer=MANUFACTURER,
-                model=model,
-                sw_version=fw_version,
-            )
         # Avoid "CH2 CH2" when NVR channel_name equals the channel identifier
         name_part = self._channel_name.strip()
-        if name_part.upper() == f"CH{self._channel_num}":
+        ch_key = self._ch_key
+        if name_part.upper() == ch_key:
             name_part = ""
-        device_name = (
-            f"CH{self._channel_num} {name_part}" if name_part else f"CH{self._channel_num}"
-        )
+        device_name = f"{ch_key} {name_part}" if name_part else ch_key
         return DeviceInfo(
-            identifiers={(DOMAIN, f"{mac}_ch{self._channel_num}")},
+            identifiers=self._ch_identifiers,
             name=device_name,
             manufacturer=MANUFACTURER,
             via_device=(DOMAIN, mac),
         )
+
+
+class _RaySharpNVRLevelEntity(RaySharpChannelEntity):
+    """Base class for channel-style entities that belong to the NVR itself.
+
+    Uses channel 0 and reports the NVR device so those entities appear under
+    the main NVR device, not under a phantom "CH0" device.
+    """
+
+    __slots__ = ()
+
+    device_info = RaySharpEntity.device_info
+
+    def __init__(
+        self,
+        coordinator: RaySharpNVRCoordinator,
+        channel_name: str = "NVR",
+    ) -> None:
+        """Initialize the NVR-level entity."""
+        super().__init__(coordinator, 0, channel_name)
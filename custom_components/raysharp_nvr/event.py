@@ -7,6 +7,8 @@ via its EventPush HTTP mechanism.
 from __future__ import annotations
 
 import logging
+import sys
+import time
 from typing import Any
 
 from homeassistant.components.event import EventDeviceClass, EventEntity
@@ -23,13 +25,16 @@ from .const import (
     ALARM_TYPE_PERSON,
     ALARM_TYPE_PLATE,
     ALARM_TYPE_VEHICLE,
-    DATA_CHANNEL_INFO,
     DATA_DEVICE_INFO,
     DOMAIN,
     EVENT_ALARM,
 )
 from .coordinator import RaySharpNVRCoordinator
-from .entity import RaySharpChannelEntity, channel_num_from_str
+from .entity import (
+    RaySharpChannelEntity,
+    _RaySharpNVRLevelEntity,
+    channel_num_from_str,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -44,23 +49,12 @@ ALL_EVENT_TYPES = [
     ALARM_TYPE_IO,
 ]
 
+# Optional event payload fields copied into the fired event data
+_EXTRA_KEYS = ("timestamp", "details", "object_type", "zone", "confidence")
 
-def _get_channel_list(data: dict[str, Any]) -> list[dict[str, Any]]:
-    """Extract channel list from coordinator data."""
-    channel_data = data.get(DATA_CHANNEL_INFO)
-    if not channel_data:
-        return []
-    if isinstance(channel_data, dict):
-        channels = channel_data.get("channel_param", {}).get("items", [])
-        if not channels:
-            channels = channel_data.get("channels", channel_data.get("channel", []))
-    elif isinstance(channel_data, list):
-        channels = channel_data
-    else:
-        return []
-    if not isinstance(channels, list):
-        channels = [channels]
-    return channels
+# Identical events (same payload) re-delivered within this window (seconds)
+# are dropped instead of re-triggering the entity and writing state.
+_EVENT_DEDUP_WINDOW = 0.5
 
 
 async def async_setup_entry(
@@ -71,23 +65,20 @@ async def async_setup_entry(
     """Set up RaySharp NVR event entities."""
     coordinator: RaySharpNVRCoordinator = hass.data[DOMAIN][entry.entry_id]
 
-    entities: list[RaySharpAlarmEvent] = []
-
     # Create one event entity per channel for alarm events
-    channels = _get_channel_list(coordinator.data)
-    for i, channel in enumerate(channels):
-        channel_num = channel_num_from_str(channel.get("channel", ""), i + 1)
-        channel_name = channel.get("channel_name", f"Channel {channel_num}")
-        entities.append(
-            RaySharpAlarmEvent(
-                coordinator,
-                channel_num=channel_num,
-                channel_name=channel_name,
-            )
+    entities: list[RaySharpAlarmEvent] = [
+        RaySharpAlarmEvent(
+            coordinator,
+            channel_num=(
+                channel_num := channel_num_from_str(channel.get("channel", ""), i + 1)
+            ),
+            channel_name=channel.get("channel_name", f"Channel {channel_num}"),
         )
+        for i, channel in enumerate(coordinator.channels)
+    ]
 
     # Also create an NVR-level event entity for system-wide alarms
-    entities.append(RaySharpAlarmEvent(coordinator, channel_num=0, channel_name="NVR"))
+    entities.append(RaySharpNVRAlarmEvent(coordinator))
 
     async_add_entities(entities)
 
@@ -98,8 +89,11 @@ class RaySharpAlarmEvent(RaySharpChannelEntity, EventEntity):
     Fires when the NVR pushes an alarm event via the webhook.
     """
 
+    __slots__ = ("_last_event_signature", "_last_event_time")
+
     _attr_device_class = EventDeviceClass.MOTION
     _attr_event_types = ALL_EVENT_TYPES
+    _is_nvr_level = False
 
     def __init__(
         self,
@@ -111,13 +105,10 @@ class RaySharpAlarmEvent(RaySharpChannelEntity, EventEntity):
         super().__init__(coordinator, channel_num, channel_name)
         device_data = coordinator.data.get(DATA_DEVICE_INFO, {}) or {}
         mac = device_data.get("mac_addr", "unknown")
-
-        if channel_num == 0:
-            self._attr_unique_id = f"{mac}_alarm_event_nvr"
-            self._attr_name = "NVR Alarm"
-        else:
-            self._attr_unique_id = f"{mac}_ch{channel_num}_alarm_event"
-            self._attr_name = "Alarm"
+        self._attr_unique_id = f"{mac}_ch{channel_num}_alarm_event"
+        self._attr_name = "Alarm"
+        self._last_event_signature: tuple[Any, ...] | None = None
+        self._last_event_time = 0.0
 
     async def async_added_to_hass(self) -> None:
         """Register event listener when entity is added."""
@@ -134,19 +125,53 @@ class RaySharpAlarmEvent(RaySharpChannelEntity, EventEntity):
 
         # Channel 0 entity receives all events, channel-specific entities
         # only receive events for their channel
-        if self._channel_num != 0 and event_channel != self._channel_num:
+        if not self._is_nvr_level and event_channel != self._channel_num:
             return
 
+        trigger = self._trigger_event
         alarm_type = data.get("alarm_type", ALARM_TYPE_MOTION)
+        # Events fired by other integrations or automations carry fresh
+        # strings; intern them so comparisons against the ALARM_TYPE_*
+        # constants downstream short-circuit on identity.
+        if type(alarm_type) is str:
+            alarm_type = sys.intern(alarm_type)
         event_data = {
             "channel": event_channel,
             "alarm_type": alarm_type,
         }
 
         # Include any extra data from the event
-        for key in ("timestamp", "details", "object_type", "zone", "confidence"):
+        for key in _EXTRA_KEYS:
             if key in data:
                 event_data[key] = data[key]
 
-        self._trigger_event(alarm_type, event_data)
+        # Skip a duplicate of the event we just fired (NVR re-delivery, or the
+        # same alarm arriving via both the webhook and Event Check polling)
+        signature = tuple(event_data.items())
+        now = time.monotonic()
+        if (
+            signature == self._last_event_signature
+            and now - self._last_event_time < _EVENT_DEDUP_WINDOW
+        ):
+            return
+        self._last_event_signature = signature
+        self._last_event_time = now
+
+        trigger(alarm_type, event_data)
         self.async_write_ha_state()
+
+
+class RaySharpNVRAlarmEvent(_RaySharpNVRLevelEntity, RaySharpAlarmEvent):
+    """NVR-level event entity that receives alarm events from all channels."""
+
+    __slots__ = ()
+
+    _is_nvr_level = True
+
+    def __init__(self, coordinator: RaySharpNVRCoordinator) -> None:
+        """Initialize the NVR-level event entity."""
+        super().__init__(coordinator)
+        device_data = coordinator.data.get(DATA_DEVICE_INFO, {}) or {}
+        mac = device_data.get("mac_addr", "unknown")
+        self._attr_unique_id = f"{mac}_alarm_event_nvr"
+        self._attr_name = "NVR Alarm"
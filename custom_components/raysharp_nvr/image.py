@@ -10,11 +10,16 @@ Provides image entities per channel:
 
 from __future__ import annotations
 
-import base64
+import asyncio
+import binascii
+import heapq
+from collections import OrderedDict, deque
 from collections.abc import Callable
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, tzinfo
+from functools import lru_cache
 import logging
+import sys
 from typing import Any
 
 from homeassistant.components.image import ImageEntity
@@ -22,6 +27,7 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.start import async_at_started
 from homeassistant.helpers.storage import Store
 import homeassistant.util.dt as dt_util
 
@@ -34,10 +40,11 @@ from .const import (
     API_AI_OBJECTS_GET_BY_INDEX,
     API_AI_VHD_GET,
     CONF_SNAPSHOT_HISTORY_COUNT,
-    DATA_CHANNEL_INFO,
     DATA_DEVICE_INFO,
     DEFAULT_SNAPSHOT_HISTORY_COUNT,
     DOMAIN,
+    DOMAIN_SNAPSHOT_DISPATCH,
+    DOMAIN_SNAPSHOT_SAVE,
     EVENT_SNAPSHOT,
     STORAGE_KEY_SNAPSHOTS_PREFIX,
     STORAGE_VERSION,
@@ -58,22 +65,77 @@ _HISTORY_ALARM_TYPES = (
 # Debounce delay (seconds) before flushing metadata to HA Store
 _SAVE_DEBOUNCE_S = 30
 
+# Budget for decoded history images held in memory across all stores; the
+# least recently used are dropped (and re-fetched from the NVR if needed).
+_IMAGE_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+# GetByIndex lookup per alarm type: (endpoint, response list key, image fields
+# in order of preference)
+_GET_BY_INDEX: dict[str, tuple[str, str, tuple[str, ...]]] = {
+    ALARM_TYPE_PLATE: (
+        API_AI_OBJECTS_GET_BY_INDEX,
+        "PlateInfo",
+        ("BgImg", "PlateImg"),
+    ),
+    ALARM_TYPE_FACE: (
+        API_AI_FACES_GET_BY_INDEX,
+        "SnapedFaceInfo",
+        ("FaceImage", "Image2", "Image4"),
+    ),
+    ALARM_TYPE_PERSON: (API_AI_VHD_GET, "SnapedObjInfo", ("ObjectImage",)),
+    ALARM_TYPE_VEHICLE: (API_AI_VHD_GET, "SnapedObjInfo", ("ObjectImage",)),
+}
+
+# Search margin around a snapshot timestamp, the furthest another pending
+# entry may be from it to be folded into the same GetByIndex request, and the
+# most entries one request may cover (keeps busy channels from pulling a
+# whole hour of images in one response)
+_FETCH_MARGIN = timedelta(minutes=2)
+_FETCH_BATCH_SPAN = timedelta(minutes=30)
+_FETCH_BATCH_MAX_ENTRIES = 8
+
 
 # ─── Helpers ───────────────────────────────────────────────────────────────────
 
-def _get_channel_list(data: dict[str, Any]) -> list[dict[str, Any]]:
-    channel_data = data.get(DATA_CHANNEL_INFO)
-    if not channel_data:
-        return []
-    if isinstance(channel_data, dict):
-        channels = channel_data.get("channel_param", {}).get("items", [])
-        if not channels:
-            channels = channel_data.get("channels", channel_data.get("channel", []))
-    elif isinstance(channel_data, list):
-        channels = channel_data
-    else:
-        return []
-    return channels if isinstance(channels, list) else [channels]
+@lru_cache(maxsize=4096)
+def _parse_nvr_ts(ts: str) -> datetime | None:
+    """Parse a naive "%Y-%m-%d %H:%M:%S" NVR timestamp.
+
+    The fixed layout is sliced directly, which is much cheaper than strptime;
+    anything else falls back to strptime.
+    """
+    if (
+        len(ts) == 19
+        and ts[4] == "-"
+        and ts[7] == "-"
+        and ts[10] == " "
+        and ts[13] == ":"
+        and ts[16] == ":"
+    ):
+        try:
+            return datetime(
+                int(ts[0:4]),
+                int(ts[5:7]),
+                int(ts[8:10]),
+                int(ts[11:13]),
+                int(ts[14:16]),
+                int(ts[17:19]),
+            )
+        except ValueError:
+            pass
+    try:
+        return datetime.strptime(ts, "%Y-%m-%d %H:%M:%S")
+    except ValueError:
+        return None
+
+
+@lru_cache(maxsize=4096)
+def _local_ts_to_utc(ts: str, tz: tzinfo) -> datetime | None:
+    """Interpret a naive NVR timestamp in *tz* and convert it to UTC."""
+    naive_dt = _parse_nvr_ts(ts)
+    if naive_dt is None:
+        return None
+    return dt_util.as_utc(naive_dt.replace(tzinfo=tz))
 
 
 def _parse_ts_to_dt(ts: Any) -> datetime | None:
@@ -90,15 +152,22 @@ def _parse_ts_to_dt(ts: Any) -> datetime | None:
             return datetime.fromtimestamp(float(ts), tz=dt_util.UTC)
         except (ValueError, OSError):
             return None
-    try:
-        naive_dt = datetime.strptime(str(ts), "%Y-%m-%d %H:%M:%S")
-        # Localise as HA timezone → convert to UTC
-        return dt_util.as_utc(naive_dt.replace(tzinfo=dt_util.DEFAULT_TIME_ZONE))
-    except (ValueError, AttributeError):
-        pass
+    # Localise as HA timezone → convert to UTC.  The zone is part of the
+    # cache key so a timezone change in HA config is picked up.
+    utc_dt = _local_ts_to_utc(str(ts), dt_util.DEFAULT_TIME_ZONE)
+    if utc_dt is not None:
+        return utc_dt
     return dt_util.parse_datetime(str(ts))
 
 
+def _b64decode(img_b64: str | bytes) -> bytes | None:
+    """Decode a base64 JPEG payload with the C-level binascii decoder."""
+    try:
+        return binascii.a2b_base64(img_b64)
+    except (binascii.Error, ValueError, TypeError):
+        return None
+
+
 def _extract_list(resp: Any, key: str) -> list[dict[str, Any]]:
     """Pull a list of dicts from a NVR API response envelope under data.<key>."""
     if not isinstance(resp, dict):
@@ -112,17 +181,180 @@ def _extract_list(resp: Any, key: str) -> list[dict[str, Any]]:
     return [i for i in items if isinstance(i, dict)]
 
 
+# ─── Snapshot Dispatcher ───────────────────────────────────────────────────────
+
+class _SnapshotImage:
+    """A snapshot event's base64 image, decoded on first use.
+
+    One instance is shared by every subscriber of the event, so the JPEG is
+    decoded at most once, and not at all if nobody asks for it.
+    """
+
+    __slots__ = ("_b64", "_bytes")
+
+    def __init__(self, img_b64: str | bytes) -> None:
+        self._b64: str | bytes | None = img_b64
+        self._bytes: bytes | None = None
+
+    def get(self) -> bytes | None:
+        """Return the decoded bytes, decoding (and dropping the base64) once."""
+        if self._b64 is not None:
+            self._bytes = _b64decode(self._b64)
+            self._b64 = None
+        return self._bytes
+
+
+# Called with the event data and its shared image (None if the event had none)
+SnapshotCallback = Callable[[dict[str, Any], _SnapshotImage | None], None]
+
+
+class _SnapshotDispatcher:
+    """Single EVENT_SNAPSHOT listener fanning out to per-channel subscribers.
+
+    Subscribers are keyed by ``(channel, alarm_type)``; ``(channel, None)``
+    receives every alarm type for the channel.  The bus calls one callback
+    per event instead of one per entity/store, each filtering for itself.
+    Every subscriber gets the same lazily decoded _SnapshotImage.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self._hass = hass
+        # Tuples are replaced (never mutated) on (un)subscribe, so dispatch can
+        # iterate them directly while a callback unsubscribes.
+        self._subscribers: dict[
+            tuple[Any, str | None], tuple[SnapshotCallback, ...]
+        ] = {}
+        self._unsub: Callable[[], None] | None = None
+
+    @classmethod
+    def get(cls, hass: HomeAssistant) -> _SnapshotDispatcher:
+        """Return the dispatcher shared by all config entries."""
+        dispatcher = hass.data.get(DOMAIN_SNAPSHOT_DISPATCH)
+        if dispatcher is None:
+            dispatcher = hass.data[DOMAIN_SNAPSHOT_DISPATCH] = cls(hass)
+        return dispatcher
+
+    @callback
+    def async_subscribe(
+        self, channel: int, alarm_type: str | None, cb: SnapshotCallback
+    ) -> Callable[[], None]:
+        """Subscribe *cb* to snapshots for a channel (and alarm type)."""
+        key = (channel, alarm_type)
+        self._subscribers[key] = (*self._subscribers.get(key, ()), cb)
+        if self._unsub is None:
+            self._unsub = self._hass.bus.async_listen(
+                EVENT_SNAPSHOT, self._handle_snapshot
+            )
+
+        @callback
+        def _unsubscribe() -> None:
+            subs = self._subscribers.get(key, ())
+            if cb not in subs:
+                return
+            remaining = tuple(other for other in subs if other is not cb)
+            if remaining:
+                self._subscribers[key] = remaining
+            else:
+                del self._subscribers[key]
+            if not self._subscribers and self._unsub is not None:
+                self._unsub()
+                self._unsub = None
+                self._hass.data.pop(DOMAIN_SNAPSHOT_DISPATCH, None)
+
+        return _unsubscribe
+
+    @callback
+    def _handle_snapshot(self, event: Any) -> None:
+        data = event.data
+        channel = data.get("channel")
+        subscribers = self._subscribers
+        typed = subscribers.get((channel, data.get("alarm_type")), ())
+        untyped = subscribers.get((channel, None), ())
+        if not typed and not untyped:
+            return
+        img_b64 = data.get("image")
+        image = _SnapshotImage(img_b64) if img_b64 else None
+        for cb in typed:
+            cb(data, image)
+        for cb in untyped:
+            cb(data, image)
+
+
+class _SnapshotSaveScheduler:
+    """Coalesce debounced metadata writes of every history store.
+
+    Stores mark themselves dirty on each new entry; a single timer per HA
+    instance then saves all dirty stores together instead of every store
+    running (and re-arming) its own debounce timer.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self._hass = hass
+        self._dirty: set[SnapshotHistoryStore] = set()
+        self._unsub: Callable[[], None] | None = None
+
+    @classmethod
+    def get(cls, hass: HomeAssistant) -> _SnapshotSaveScheduler:
+        """Return the scheduler shared by all config entries."""
+        scheduler = hass.data.get(DOMAIN_SNAPSHOT_SAVE)
+        if scheduler is None:
+            scheduler = hass.data[DOMAIN_SNAPSHOT_SAVE] = cls(hass)
+        return scheduler
+
+    @callback
+    def async_mark_dirty(self, store: SnapshotHistoryStore) -> None:
+        """Schedule *store* for the next batched save."""
+        self._dirty.add(store)
+        if self._unsub is None:
+            self._unsub = async_call_later(
+                self._hass, _SAVE_DEBOUNCE_S, self._async_flush
+            )
+
+    @callback
+    def async_discard(self, store: SnapshotHistoryStore) -> bool:
+        """Drop *store* from the pending batch; return True if it was dirty."""
+        if store not in self._dirty:
+            return False
+        self._dirty.discard(store)
+        if not self._dirty and self._unsub is not None:
+            self._unsub()
+            self._unsub = None
+            self._hass.data.pop(DOMAIN_SNAPSHOT_SAVE, None)
+        return True
+
+    @callback
+    def _async_flush(self, _now: Any) -> None:
+        self._unsub = None
+        stores, self._dirty = self._dirty, set()
+        self._hass.data.pop(DOMAIN_SNAPSHOT_SAVE, None)
+        self._hass.async_create_task(
+            self._async_save_all(stores), "raysharp_nvr_snapshot_history_save"
+        )
+
+    @staticmethod
+    async def _async_save_all(stores: set[SnapshotHistoryStore]) -> None:
+        await asyncio.gather(*(store.async_save() for store in stores))
+
+
 # ─── Snapshot Entry ────────────────────────────────────────────────────────────
 
-@dataclass
+@dataclass(slots=True)
 class SnapshotEntry:
-    """One snapshot record: metadata + optional in-memory image bytes."""
+    """One snapshot record: metadata + optional in-memory image.
+
+    Live snapshots hold the event's shared image until it is first
+    requested, then keep the decoded bytes in the image LRU; restored or
+    evicted entries are fetched from the NVR instead.
+    """
 
     snap_id: int | str | None
     timestamp: str | int | float | None
     channel: int
     alarm_type: str
     image_bytes: bytes | None = field(default=None, compare=False, repr=False)
+    pending_image: _SnapshotImage | None = field(
+        default=None, compare=False, repr=False
+    )
     plate_number: str | None = None
     grp_id: int | None = None
     car_brand: str | None = None
@@ -130,12 +362,102 @@ class SnapshotEntry:
     face_id: int | None = None
     face_name: str | None = None
     similarity: float | int | None = None
+    # State attributes for the history entity, built once from the fields
+    attrs: dict[str, Any] = field(
+        init=False, default_factory=dict, compare=False, repr=False
+    )
+
+    def __post_init__(self) -> None:
+        # Low-cardinality labels arrive as fresh strings from every JSON
+        # decode; intern them so entries share one copy and compare by
+        # identity.  Plate numbers and face names are left alone.
+        if type(self.alarm_type) is str:
+            self.alarm_type = sys.intern(self.alarm_type)
+        if type(self.car_brand) is str:
+            self.car_brand = sys.intern(self.car_brand)
+        if type(self.car_color) is str:
+            self.car_color = sys.intern(self.car_color)
+        attrs = self.attrs
+        for attr_name in _ATTRIBUTE_FIELDS:
+            val = getattr(self, attr_name)
+            if val is not None:
+                attrs[attr_name] = val
+
+
+# Entries holding decoded image bytes, keyed by id(), least recently used
+# first.  Holding the entry keeps its id() from being reused while cached.
+_image_lru: OrderedDict[int, SnapshotEntry] = OrderedDict()
+_image_lru_bytes = 0
+
+
+def _cache_image(entry: SnapshotEntry, image_bytes: bytes) -> None:
+    """Attach decoded bytes to *entry*, evicting others over the budget."""
+    global _image_lru_bytes  # noqa: PLW0603
+    entry.image_bytes = image_bytes
+    _image_lru[id(entry)] = entry
+    _image_lru_bytes += len(image_bytes)
+    while _image_lru_bytes > _IMAGE_CACHE_MAX_BYTES and len(_image_lru) > 1:
+        _, evicted = _image_lru.popitem(last=False)
+        if evicted.image_bytes is not None:
+            _image_lru_bytes -= len(evicted.image_bytes)
+            evicted.image_bytes = None
+
+
+def _uncache_image(entry: SnapshotEntry) -> None:
+    """Release *entry*'s image (cached or still undecoded) once it has left its ring."""
+    global _image_lru_bytes  # noqa: PLW0603
+    entry.pending_image = None
+    if _image_lru.pop(id(entry), None) is not None and entry.image_bytes is not None:
+        _image_lru_bytes -= len(entry.image_bytes)
+        entry.image_bytes = None
+
+
+# Entry fields exposed as history entity state attributes, when set
+_ATTRIBUTE_FIELDS = (
+    "snap_id",
+    "timestamp",
+    "plate_number",
+    "grp_id",
+    "car_brand",
+    "car_color",
+    "face_id",
+    "face_name",
+    "similarity",
+)
+
+_OPTIONAL_ENTRY_FIELDS = (
+    "plate_number",
+    "grp_id",
+    "car_brand",
+    "car_color",
+    "face_id",
+    "face_name",
+    "similarity",
+)
+
+
+def _serialize_entry(e: SnapshotEntry) -> dict[str, Any]:
+    """Return the HA Store representation of an entry (no image bytes)."""
+    d: dict[str, Any] = {
+        "snap_id": e.snap_id,
+        "timestamp": e.timestamp,
+        "channel": e.channel,
+        "alarm_type": e.alarm_type,
+    }
+    for attr in _OPTIONAL_ENTRY_FIELDS:
+        val = getattr(e, attr)
+        if val is not None:
+            d[attr] = val
+    return d
 
 
 # ─── Snapshot History Store ────────────────────────────────────────────────────
 
 class SnapshotHistoryStore:
-    """Persistent ring-buffer of last N snapshots for one (channel, alarm_type).
+    """Persistent ring-buffers of last N snapshots for one channel.
+
+    Holds one ring per alarm type so a single event subscription and a single
+    storage file serve every history entity of the channel.
 
     Metadata is stored in HA Store (.storage/); image bytes stay in memory only.
     On HA restart the metadata is restored; images are fetched from the NVR on
@@ -146,103 +468,190 @@ class SnapshotHistoryStore:
         self,
         hass: HomeAssistant,
         channel_num: int,
-        alarm_type: str,
+        alarm_types: tuple[str, ...],
         max_entries: int,
     ) -> None:
         self._hass = hass
         self._channel_num = channel_num
-        self._alarm_type = alarm_type
+        self._alarm_types = alarm_types
         self._max_entries = max_entries
-        self._store_key = f"{STORAGE_KEY_SNAPSHOTS_PREFIX}_{channel_num}_{alarm_type}"
+        self._store_key = f"{STORAGE_KEY_SNAPSHOTS_PREFIX}_{channel_num}"
         self._store: Store | None = None
-        self._entries: list[SnapshotEntry] = []
-        self._notify_callbacks: list[Callable[[], None]] = []
-        self._save_unsub: Callable[[], None] | None = None
+        # Newest first; the bounded deque drops the oldest entry on prepend
+        self._rings: dict[str, deque[SnapshotEntry]] = {
+            alarm_type: deque(maxlen=max_entries) for alarm_type in alarm_types
+        }
+        # Store-ready dicts kept in step with the rings, built once per entry
+        self._serialized: dict[str, deque[dict[str, Any]]] = {
+            alarm_type: deque(maxlen=max_entries) for alarm_type in alarm_types
+        }
+        self._notify_callbacks: dict[str, list[Callable[[], None]]] = {
+            alarm_type: [] for alarm_type in alarm_types
+        }
         self._event_unsub: Callable[[], None] | None = None
+        self._loaded = False
+        self._load_lock = asyncio.Lock()
+        # alarm_type → (window start, window end, GetByIndex task) being awaited
+        self._inflight: dict[
+            str, tuple[datetime, datetime, asyncio.Task[dict[str, dict[str, Any]]]]
+        ] = {}
+
+    async def async_ensure_loaded(self) -> None:
+        """Load persisted metadata from HA Store once.
+
+        Loading is deferred until after HA startup (or the first access that
+        needs it).  Snapshots received before then are newer than anything
+        stored, so the stored entries are appended behind them.
+        """
+        if self._loaded:
+            return
+        async with self._load_lock:
+            if self._loaded:
+                return
+            self._store = Store(self._hass, STORAGE_VERSION, self._store_key)
+            stored = await self._store.async_load()
+            migrated = False
+            if isinstance(stored, dict):
+                for alarm_type, ring in self._rings.items():
+                    section = stored.get(alarm_type)
+                    if isinstance(section, dict):
+                        self._load_ring(ring, alarm_type, section.get("entries", []))
+            else:
+                migrated = await self._async_migrate_legacy_stores()
+            self._loaded = True
+        if migrated:
+            await self.async_save()
+        for callbacks in self._notify_callbacks.values():
+            for cb in callbacks:
+                cb()
 
-    async def async_load(self) -> None:
-        """Load persisted metadata from HA Store and start listening for events."""
-        self._store = Store(self._hass, STORAGE_VERSION, self._store_key)
-        stored = await self._store.async_load()
-        if isinstance(stored, dict):
-            for e in stored.get("entries", []):
-                if not isinstance(e, dict):
-                    continue
-                self._entries.append(
-                    SnapshotEntry(
-                        snap_id=e.get("snap_id"),
-                        timestamp=e.get("timestamp"),
-                        channel=e.get("channel", self._channel_num),
-                        alarm_type=e.get("alarm_type", self._alarm_type),
-                        image_bytes=None,
-                        plate_number=e.get("plate_number"),
-                        grp_id=e.get("grp_id"),
-                        car_brand=e.get("car_brand"),
-                        car_color=e.get("car_color"),
-                        face_id=e.get("face_id"),
-                        face_name=e.get("face_name"),
-                        similarity=e.get("similarity"),
-                    )
-                )
-        self._event_unsub = self._hass.bus.async_listen(
-            EVENT_SNAPSHOT, self._handle_snapshot
-        )
+    @callback
+    def async_start(self) -> None:
+        """Start receiving snapshot events for this channel."""
+        dispatcher = _SnapshotDispatcher.get(self._hass)
+        unsubs = [
+            dispatcher.async_subscribe(
+                self._channel_num, alarm_type, self._handle_snapshot
+            )
+            for alarm_type in self._alarm_types
+        ]
+
+        @callback
+        def _unsubscribe_all() -> None:
+            for unsub in unsubs:
+                unsub()
+
+        self._event_unsub = _unsubscribe_all
+
+    async def _async_migrate_legacy_stores(self) -> bool:
+        """Import the older one-file-per-alarm-type stores, then remove them."""
+        migrated = False
+        for alarm_type, ring in self._rings.items():
+            legacy = Store(
+                self._hass,
+                STORAGE_VERSION,
+                f"{STORAGE_KEY_SNAPSHOTS_PREFIX}_{self._channel_num}_{alarm_type}",
+            )
+            stored = await legacy.async_load()
+            if not isinstance(stored, dict):
+                continue
+            self._load_ring(ring, alarm_type, stored.get("entries", []))
+            await legacy.async_remove()
+            migrated = True
+        return migrated
+
+    def _load_ring(
+        self, ring: deque[SnapshotEntry], alarm_type: str, entries: Any
+    ) -> None:
+        """Fill *ring* from serialised entries (newest first) until it is full."""
+        if not isinstance(entries, list):
+            return
+        serialized = self._serialized[alarm_type]
+        for e in entries:
+            if len(ring) >= self._max_entries:
+                break
+            if not isinstance(e, dict):
+                continue
+            entry = SnapshotEntry(
+                snap_id=e.get("snap_id"),
+                timestamp=e.get("timestamp"),
+                channel=e.get("channel", self._channel_num),
+                alarm_type=e.get("alarm_type", alarm_type),
+                image_bytes=None,
+                plate_number=e.get("plate_number"),
+                grp_id=e.get("grp_id"),
+                car_brand=e.get("car_brand"),
+                car_color=e.get("car_color"),
+                face_id=e.get("face_id"),
+                face_name=e.get("face_name"),
+                similarity=e.get("similarity"),
+            )
+            ring.append(entry)
+            serialized.append(_serialize_entry(entry))
 
     @callback
     def async_unload(self) -> None:
-        """Cancel event listener and flush any pending save on unload."""
+        """Cancel event listener, drop cached images and flush pending saves."""
         if self._event_unsub:
             self._event_unsub()
             self._event_unsub = None
-        if self._save_unsub:
-            self._save_unsub()
-            self._save_unsub = None
+        # Don't keep this entry's JPEGs in the process-wide cache
+        for ring in self._rings.values():
+            for entry in ring:
+                _uncache_image(entry)
+        scheduler: _SnapshotSaveScheduler | None = self._hass.data.get(
+            DOMAIN_SNAPSHOT_SAVE
+        )
+        if scheduler is not None and scheduler.async_discard(self):
             # Flush metadata that was pending a debounced write
             self._hass.async_create_task(self.async_save())
 
-    def register_callback(self, cb: Callable[[], None]) -> Callable[[], None]:
-        """Register a callback invoked when the entry list changes.
+    def register_callback(
+        self, alarm_type: str, cb: Callable[[], None]
+    ) -> Callable[[], None]:
+        """Register a callback invoked when an alarm type's entries change.
 
         Returns an unregister callable for use with ``async_on_remove``.
         """
-        self._notify_callbacks.append(cb)
+        callbacks = self._notify_callbacks[alarm_type]
+        callbacks.append(cb)
 
         def _unregister() -> None:
             try:
-                self._notify_callbacks.remove(cb)
+                callbacks.remove(cb)
             except ValueError:
                 pass
 
         return _unregister
 
     @callback
-    def _handle_snapshot(self, event: Any) -> None:
-        data = event.data
-        if data.get("channel") != self._channel_num:
-            return
-        if data.get("alarm_type") != self._alarm_type:
-            return
+    def _handle_snapshot(
+        self, data: dict[str, Any], image: _SnapshotImage | None
+    ) -> None:
+        alarm_type = data["alarm_type"]
 
-        img_b64 = data.get("image", "")
-        image_bytes: bytes | None = None
-        if img_b64:
-            try:
-                image_bytes = base64.b64decode(img_b64)
-            except Exception:
-                pass
+        # The NVR re-emits events; a repeat of the newest entry needs no
+        # new entry, notification or save.
+        snap_id = data.get("snap_id")
+        ring = self._rings[alarm_type]
+        if snap_id is not None and ring and ring[0].snap_id == snap_id:
+            return
 
-        self._add_entry(data, image_bytes)
+        self._add_entry(alarm_type, data, image)
 
     def _add_entry(
-        self, snap_data: dict[str, Any], image_bytes: bytes | None
+        self,
+        alarm_type: str,
+        snap_data: dict[str, Any],
+        image: _SnapshotImage | None,
     ) -> None:
-        """Prepend new entry, trim to max_entries, schedule save, notify."""
+        """Prepend new entry to the alarm type's ring, schedule save, notify."""
         entry = SnapshotEntry(
             snap_id=snap_data.get("snap_id"),
             timestamp=snap_data.get("start_time") or snap_data.get("timestamp"),
             channel=self._channel_num,
-            alarm_type=self._alarm_type,
-            image_bytes=image_bytes,
+            alarm_type=alarm_type,
+            pending_image=image,
             plate_number=snap_data.get("plate_number"),
             grp_id=snap_data.get("grp_id"),
             car_brand=snap_data.get("car_brand"),
@@ -251,138 +660,191 @@ class SnapshotHistoryStore:
             face_name=snap_data.get("face_name"),
             similarity=snap_data.get("similarity"),
         )
-        self._entries.insert(0, entry)
-        self._entries = self._entries[: self._max_entries]
-
-        # Debounce: cancel pending save and reschedule
-        if self._save_unsub is not None:
-            self._save_unsub()
-        self._save_unsub = async_call_later(
-            self._hass, _SAVE_DEBOUNCE_S, self._trigger_save
-        )
+        ring = self._rings[alarm_type]
+        if len(ring) == ring.maxlen:
+            _uncache_image(ring[-1])
+        ring.appendleft(entry)
+        self._serialized[alarm_type].appendleft(_serialize_entry(entry))
 
-        for cb in list(self._notify_callbacks):
-            cb()
+        _SnapshotSaveScheduler.get(self._hass).async_mark_dirty(self)
 
-    @callback
-    def _trigger_save(self, _now: Any) -> None:
-        self._save_unsub = None
-        self._hass.async_create_task(self.async_save())
+        # Callbacks are only (un)registered from entity add/remove, never from
+        # inside a notification, so iterate without a defensive copy.
+        for cb in self._notify_callbacks[alarm_type]:
+            cb()
 
     async def async_save(self) -> None:
         """Persist entry metadata (without image bytes) to HA Store."""
+        # Never overwrite the stored history with a partial, pre-load view
+        await self.async_ensure_loaded()
         if self._store is None:
             return
-        serialized: list[dict[str, Any]] = []
-        for e in self._entries:
-            d: dict[str, Any] = {
-                "snap_id": e.snap_id,
-                "timestamp": e.timestamp,
-                "channel": e.channel,
-                "alarm_type": e.alarm_type,
-            }
-            for attr in (
-                "plate_number",
-                "grp_id",
-                "car_brand",
-                "car_color",
-                "face_id",
-                "face_name",
-                "similarity",
-            ):
-                val = getattr(e, attr)
-                if val is not None:
-                    d[attr] = val
-            serialized.append(d)
-        await self._store.async_save({"entries": serialized})
+        payload = {
+            alarm_type: {"entries": list(serialized)}
+            for alarm_type, serialized in self._serialized.items()
+        }
+        await self._store.async_save(payload)
 
-    def get_entry(self, slot: int) -> SnapshotEntry | None:
+    def get_entry(self, alarm_type: str, slot: int) -> SnapshotEntry | None:
         """Return entry at 0-based slot (0 = newest), or None if not available."""
-        if 0 <= slot < len(self._entries):
-            return self._entries[slot]
+        ring = self._rings.get(alarm_type)
+        if ring is not None and 0 <= slot < len(ring):
+            return ring[slot]
         return None
 
     async def async_fetch_image(
-        self, slot: int, coordinator: RaySharpNVRCoordinator
+        self, alarm_type: str, slot: int, coordinator: RaySharpNVRCoordinator
     ) -> bytes | None:
         """Return image bytes for a slot, fetching from NVR if not in memory."""
-        entry = self.get_entry(slot)
+        await self.async_ensure_loaded()
+        entry = self.get_entry(alarm_type, slot)
         if entry is None:
             return None
         if entry.image_bytes is not None:
+            _image_lru.move_to_end(id(entry))
             return entry.image_bytes
-        image_bytes = await self._async_fetch_from_nvr(entry, coordinator)
-        if image_bytes:
-            entry.image_bytes = image_bytes
+        if (image := entry.pending_image) is not None:
+            # Shared with the latest-detection entity, so a snapshot it has
+            # already shown is not decoded again
+            entry.pending_image = None
+            if (image_bytes := image.get()) is not None:
+                _cache_image(entry, image_bytes)
+                return image_bytes
+        image_bytes = await self._async_fetch_from_nvr(alarm_type, entry, coordinator)
+        if image_bytes and entry.image_bytes is None:
+            _cache_image(entry, image_bytes)
         return image_bytes
 
     async def _async_fetch_from_nvr(
-        self, entry: SnapshotEntry, coordinator: RaySharpNVRCoordinator
+        self,
+        alarm_type: str,
+        entry: SnapshotEntry,
+        coordinator: RaySharpNVRCoordinator,
     ) -> bytes | None:
-        """Search NVR for image bytes matching entry.snap_id within ±2 min."""
+        """Search NVR for image bytes matching entry.snap_id within ±2 min.
+
+        Concurrent fetches for the same alarm type (e.g. every history slot
+        rendering after a restart) share one GetByIndex request whose window
+        covers the nearest entries still missing their image.  If the shared
+        result lacks this entry (the NVR caps how many records it returns),
+        it is retried with a window around this entry alone.
+        """
         if entry.snap_id is None or entry.timestamp is None:
             return None
+        spec = _GET_BY_INDEX.get(alarm_type)
+        if spec is None:
+            return None
 
         # Parse as naive local time — NVR API expects local time strings.
-        try:
-            naive_dt = datetime.strptime(str(entry.timestamp), "%Y-%m-%d %H:%M:%S")
-        except (ValueError, TypeError):
+        naive_dt = _parse_nvr_ts(str(entry.timestamp))
+        if naive_dt is None:
             return None
 
-        start_str = (naive_dt - timedelta(minutes=2)).strftime("%Y-%m-%d %H:%M:%S")
-        end_str = (naive_dt + timedelta(minutes=2)).strftime("%Y-%m-%d %H:%M:%S")
-        ch_0 = self._channel_num - 1  # NVR GetByIndex uses 0-based channel index
+        batch = self._inflight.get(alarm_type)
+        if batch is None or not (
+            batch[0] <= naive_dt - _FETCH_MARGIN
+            and naive_dt + _FETCH_MARGIN <= batch[1]
+        ):
+            batch = self._start_fetch_batch(alarm_type, naive_dt, coordinator)
+
         # Normalise snap_id to string for type-safe comparison (NVR may return int
         # while JSON storage may deserialise it differently).
-        snap_id_str = str(entry.snap_id)
+        snap_id = str(entry.snap_id)
+        items = await self._async_batch_items(batch, alarm_type, snap_id)
+        item = items.get(snap_id)
+        if item is None and batch[1] - batch[0] > 2 * _FETCH_MARGIN:
+            batch = self._start_fetch_batch(
+                alarm_type, naive_dt, coordinator, widen=False
+            )
+            items = await self._async_batch_items(batch, alarm_type, snap_id)
+            item = items.get(snap_id)
+        if item is None:
+            return None
+        for img_key in spec[2]:
+            img = item.get(img_key)
+            if img:
+                return _b64decode(img)
+        return None
 
+    async def _async_batch_items(
+        self,
+        batch: tuple[datetime, datetime, asyncio.Task[dict[str, dict[str, Any]]]],
+        alarm_type: str,
+        snap_id: str,
+    ) -> dict[str, dict[str, Any]]:
+        """Await a GetByIndex batch, returning no items if it failed."""
         try:
-            if self._alarm_type == ALARM_TYPE_PLATE:
-                resp = await coordinator.client.async_api_call(
-                    API_AI_OBJECTS_GET_BY_INDEX,
-                    {"Chn": [ch_0], "StartTime": start_str, "EndTime": end_str},
-                )
-                for item in _extract_list(resp, "PlateInfo"):
-                    if str(item.get("SnapId", "")) == snap_id_str:
-                        img = item.get("BgImg") or item.get("PlateImg")
-                        if img:
-                            return base64.b64decode(img)
-
-            elif self._alarm_type == ALARM_TYPE_FACE:
-                resp = await coordinator.client.async_api_call(
-                    API_AI_FACES_GET_BY_INDEX,
-                    {"Chn": [ch_0], "StartTime": start_str, "EndTime": end_str},
-                )
-                for item in _extract_list(resp, "SnapedFaceInfo"):
-                    if str(item.get("SnapId", "")) == snap_id_str:
-                        img = (
-                            item.get("FaceImage")
-                            or item.get("Image2")
-                            or item.get("Image4")
-                        )
-                        if img:
-                            return base64.b64decode(img)
-
-            elif self._alarm_type in (ALARM_TYPE_PERSON, ALARM_TYPE_VEHICLE):
-                resp = await coordinator.client.async_api_call(
-                    API_AI_VHD_GET,
-                    {"Chn": [ch_0], "StartTime": start_str, "EndTime": end_str},
-                )
-                for item in _extract_list(resp, "SnapedObjInfo"):
-                    if str(item.get("SnapId", "")) == snap_id_str:
-                        img = item.get("ObjectImage")
-                        if img:
-                            return base64.b64decode(img)
-
+            return await asyncio.shield(batch[2])
         except Exception as err:
             _LOGGER.debug(
                 "Failed to fetch snapshot from NVR (ch=%s type=%s snap_id=%s): %s",
                 self._channel_num,
-                self._alarm_type,
-                entry.snap_id,
+                alarm_type,
+                snap_id,
                 err,
             )
-        return None
+            return {}
+
+    def _start_fetch_batch(
+        self,
+        alarm_type: str,
+        naive_dt: datetime,
+        coordinator: RaySharpNVRCoordinator,
+        widen: bool = True,
+    ) -> tuple[datetime, datetime, asyncio.Task[dict[str, dict[str, Any]]]]:
+        """Start one GetByIndex request covering pending entries near *naive_dt*.
+
+        With *widen*, the window grows to include the nearest other entries
+        still missing their image, up to _FETCH_BATCH_MAX_ENTRIES in total.
+        """
+        start = end = naive_dt
+        if widen:
+            nearby: list[datetime] = []
+            for e in self._rings[alarm_type]:
+                if (
+                    e.image_bytes is not None
+                    or e.pending_image is not None
+                    or e.snap_id is None
+                    or e.timestamp is None
+                ):
+                    continue
+                ts = _parse_nvr_ts(str(e.timestamp))
+                if ts is None or abs(ts - naive_dt) > _FETCH_BATCH_SPAN:
+                    continue
+                nearby.append(ts)
+            # The requesting entry is itself pending, so it is among the nearest
+            for ts in heapq.nsmallest(
+                _FETCH_BATCH_MAX_ENTRIES, nearby, key=lambda ts: abs(ts - naive_dt)
+            ):
+                start = min(start, ts)
+                end = max(end, ts)
+        start -= _FETCH_MARGIN
+        end += _FETCH_MARGIN
+
+        endpoint, list_key, _img_keys = _GET_BY_INDEX[alarm_type]
+        params = {
+            "Chn": [self._channel_num - 1],  # GetByIndex uses 0-based channels
+            "StartTime": start.strftime("%Y-%m-%d %H:%M:%S"),
+            "EndTime": end.strftime("%Y-%m-%d %H:%M:%S"),
+        }
+
+        async def _async_fetch() -> dict[str, dict[str, Any]]:
+            resp = await coordinator.client.async_api_call(endpoint, params)
+            return {
+                str(item.get("SnapId", "")): item
+                for item in _extract_list(resp, list_key)
+            }
+
+        task = self._hass.async_create_task(_async_fetch())
+        batch = (start, end, task)
+        self._inflight[alarm_type] = batch
+
+        def _done(_task: asyncio.Task) -> None:
+            if self._inflight.get(alarm_type) is batch:
+                del self._inflight[alarm_type]
+
+        task.add_done_callback(_done)
+        return batch
 
 
 # ─── History Image Entity ──────────────────────────────────────────────────────
@@ -421,27 +883,32 @@ class RaySharpHistoryImageEntity(RaySharpChannelEntity, ImageEntity):
         self._attr_name = f"{type_label} {slot}"
 
         # Disable entity by default if the detection type is off on this channel
-        enabled_on_nvr = _get_detection_enabled(coordinator.data, channel_num, alarm_type)
+        enabled_on_nvr = _get_detection_enabled(
+            coordinator.data, channel_num, alarm_type, self._ch_key
+        )
         self._attr_entity_registry_enabled_default = enabled_on_nvr is not False
 
         # Initialise image_last_updated from any already-loaded store entry
+        entry = history_store.get_entry(alarm_type, slot - 1)
         self._attr_image_last_updated = _parse_ts_to_dt(
-            history_store.get_entry(slot - 1).timestamp
-            if history_store.get_entry(slot - 1) is not None
-            else None
+            entry.timestamp if entry is not None else None
         )
 
     async def async_added_to_hass(self) -> None:
         """Register state-update callback with the history store."""
         await super().async_added_to_hass()
         self.async_on_remove(
-            self._history.register_callback(self._on_history_update)
+            self._history.register_callback(self._alarm_type, self._on_history_update)
         )
+        # The store may have finished loading before this entity was added
+        entry = self._history.get_entry(self._alarm_type, self._slot - 1)
+        if entry is not None:
+            self._attr_image_last_updated = _parse_ts_to_dt(entry.timestamp)
 
     @callback
     def _on_history_update(self) -> None:
         """Called by the store when a new entry is prepended."""
-        entry = self._history.get_entry(self._slot - 1)
+        entry = self._history.get_entry(self._alarm_type, self._slot - 1)
         self._attr_image_last_updated = (
             _parse_ts_to_dt(entry.timestamp) if entry is not None else None
         )
@@ -449,30 +916,17 @@ class RaySharpHistoryImageEntity(RaySharpChannelEntity, ImageEntity):
 
     async def async_image(self) -> bytes | None:
         """Return image bytes for this slot, fetching from NVR if needed."""
-        return await self._history.async_fetch_image(self._slot - 1, self.coordinator)
+        return await self._history.async_fetch_image(
+            self._alarm_type, self._slot - 1, self.coordinator
+        )
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return metadata attributes for this snapshot slot."""
-        entry = self._history.get_entry(self._slot - 1)
+        entry = self._history.get_entry(self._alarm_type, self._slot - 1)
         if not entry:
             return {}
-        attrs: dict[str, Any] = {}
-        for attr_name in (
-            "snap_id",
-            "timestamp",
-            "plate_number",
-            "grp_id",
-            "car_brand",
-            "car_color",
-            "face_id",
-            "face_name",
-            "similarity",
-        ):
-            val = getattr(entry, attr_name, None)
-            if val is not None:
-                attrs[attr_name] = val
-        return attrs
+        return entry.attrs
 
 
 # ─── Latest Detection Entity (existing behaviour, unchanged) ───────────────────
@@ -500,7 +954,7 @@ class RaySharpSnapshotImage(RaySharpChannelEntity, ImageEntity):
         mac = device_data.get("mac_addr", "unknown")
         self._attr_unique_id = f"{mac}_ch{channel_num}_snapshot"
         self._attr_translation_key = "last_detection"
-        self._image_bytes: bytes | None = None
+        self._image: _SnapshotImage | None = None
         self._attr_image_last_updated: datetime | None = None
         self._extra: dict[str, Any] = {}
 
@@ -508,22 +962,18 @@ class RaySharpSnapshotImage(RaySharpChannelEntity, ImageEntity):
         """Register snapshot event listener."""
         await super().async_added_to_hass()
         self.async_on_remove(
-            self.hass.bus.async_listen(EVENT_SNAPSHOT, self._handle_snapshot)
+            _SnapshotDispatcher.get(self.hass).async_subscribe(
+                self._channel_num, None, self._handle_snapshot
+            )
         )
 
     @callback
-    def _handle_snapshot(self, event: Any) -> None:
+    def _handle_snapshot(
+        self, data: dict[str, Any], image: _SnapshotImage | None
+    ) -> None:
         """Handle incoming snapshot event from NVR webhook."""
-        data = event.data
-        if data.get("channel") != self._channel_num:
-            return
-
-        img_b64 = data.get("image", "")
-        if img_b64:
-            try:
-                self._image_bytes = base64.b64decode(img_b64)
-            except Exception:
-                self._image_bytes = None
+        if image is not None:
+            self._image = image
 
         self._attr_image_last_updated = dt_util.utcnow()
         self._extra = {
@@ -534,7 +984,7 @@ class RaySharpSnapshotImage(RaySharpChannelEntity, ImageEntity):
 
     async def async_image(self) -> bytes | None:
         """Return the latest snapshot image bytes."""
-        return self._image_bytes
+        return self._image.get() if self._image is not None else None
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
@@ -555,8 +1005,9 @@ async def async_setup_entry(
         CONF_SNAPSHOT_HISTORY_COUNT, DEFAULT_SNAPSHOT_HISTORY_COUNT
     )
 
-    channels = _get_channel_list(coordinator.data)
+    channels = coordinator.channels
     entities: list = []
+    stores: list[SnapshotHistoryStore] = []
 
     for i, channel in enumerate(channels):
         channel_num = channel_num_from_str(channel.get("channel", ""), i + 1)
@@ -567,11 +1018,14 @@ async def async_setup_entry(
             RaySharpSnapshotImage(coordinator, channel_num, channel_name)
         )
 
-        # History image entities: one store per (channel, alarm_type), N slots each
+        # History image entities: one store per channel, N slots per alarm type
+        store = SnapshotHistoryStore(
+            hass, channel_num, _HISTORY_ALARM_TYPES, history_count
+        )
+        store.async_start()
+        entry.async_on_unload(store.async_unload)
+        stores.append(store)
         for alarm_type in _HISTORY_ALARM_TYPES:
-            store = SnapshotHistoryStore(hass, channel_num, alarm_type, history_count)
-            await store.async_load()
-            entry.async_on_unload(store.async_unload)
             for slot in range(1, history_count + 1):
                 entities.append(
                     RaySharpHistoryImageEntity(
@@ -585,3 +1039,16 @@ async def async_setup_entry(
                 )
 
     async_add_entities(entities)
+
+    # Stored history metadata is not needed to bring entities up; read the
+    # storage files concurrently once HA has finished starting.
+    async def _async_load_stores() -> None:
+        await asyncio.gather(*(store.async_ensure_loaded() for store in stores))
+
+    @callback
+    def _schedule_load(_hass: HomeAssistant) -> None:
+        entry.async_create_background_task(
+            hass, _async_load_stores(), "raysharp_nvr_snapshot_history_load"
+        )
+
+    entry.async_on_unload(async_at_started(hass, _schedule_load))
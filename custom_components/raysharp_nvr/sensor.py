@@ -2,9 +2,15 @@
 
 from __future__ import annotations
 
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
 from collections.abc import Callable
 from dataclasses import dataclass
-from datetime import datetime, timedelta
+from datetime import datetime
+from functools import lru_cache
+import string
+import time
 from typing import Any
 
 from homeassistant.components.sensor import (
@@ -25,7 +31,6 @@ from .const import (
     ALARM_TYPE_FACE,
     ALARM_TYPE_PLATE,
     API_AI_ADDED_PLATES_GET,
-    API_AI_FD_GROUPS,
     DATA_AI_CC_STATS,
     DATA_AI_CROSS_COUNTING,
     DATA_AI_FACE_STATS,
@@ -33,10 +38,8 @@ from .const import (
     DATA_AI_OBJECT_STATS,
     DATA_AI_PLATES,
     DATA_AI_VHD_COUNT,
-    DATA_CHANNEL_INFO,
     DATA_DATE_TIME,
     DATA_DEVICE_INFO,
-    DATA_DISK_CONFIG,
     DATA_EVENT_PUSH_CONFIG,
     DATA_EXCEPTION_ALARM,
     DATA_NETWORK_CONFIG,
@@ -63,50 +66,95 @@ class RaySharpSensorDescription(SensorEntityDescription):
     """Describe a RaySharp sensor."""
 
     value_fn: Callable[[dict[str, Any]], Any]
+    # Coordinator data key that must be present (not None) for the sensor
+    # to be created; exists_fn is only consulted for composite conditions.
+    exists_key: str | None = None
     exists_fn: Callable[[dict[str, Any]], bool] = lambda data: True
 
 
+@dataclass(frozen=True, kw_only=True)
+class RaySharpIndexedSensorDescription(SensorEntityDescription):
+    """Describe a sensor reading one field of the N-th disk or channel.
+
+    The shared ``indexed_value_fn`` is called with
+    ``(coordinator, index, field)`` so dynamic sensors need no per-sensor
+    closure and can read the lists the coordinator parses once per poll.
+    """
+
+    index: int
+    field: str
+    indexed_value_fn: Callable[[RaySharpNVRCoordinator, int, str], Any]
+
+
+def _section_getter(section: str, field: str) -> Callable[[dict[str, Any]], Any]:
+    """Return a value_fn reading *field* from the *section* payload."""
+
+    def _get(data: dict[str, Any]) -> Any:
+        sec = data.get(section)
+        return sec.get(field) if sec else None
+
+    return _get
+
+
+def _vhd_count_getter(type_index: int) -> Callable[[dict[str, Any]], int | None]:
+    """Return a value_fn reading today's AI count for a type from VhdLogCount.
+
+    The request is made with Type=[0=face, 1=person, 2=vehicle, 10=plate],
+    so the Count array indices are: 0→face, 1→person, 2→vehicle, 3→plate.
+    """
+
+    def _get(data: dict[str, Any]) -> int | None:
+        # Index straight in and let malformed payloads fall through to None
+        try:
+            count = data[DATA_AI_VHD_COUNT]["Count"]
+            if isinstance(count, list):
+                return int(count[type_index])
+        except (KeyError, IndexError, TypeError, ValueError):
+            pass
+        return None
+
+    return _get
+
+
 # ─── Device Info Sensors ──────────────────────────────────────────────────────
 DEVICE_INFO_SENSORS: tuple[RaySharpSensorDescription, ...] = (
     RaySharpSensorDescription(
         key="device_type",
         translation_key="device_type",
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=lambda data: (data.get(DATA_DEVICE_INFO) or {}).get("device_type"),
+        value_fn=_section_getter(DATA_DEVICE_INFO, "device_type"),
     ),
     RaySharpSensorDescription(
         key="firmware_version",
         translation_key="firmware_version",
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=lambda data: (data.get(DATA_SYSTEM_INFO) or {}).get(
-            "software_version"
-        ),
+        value_fn=_section_getter(DATA_SYSTEM_INFO, "software_version"),
     ),
     RaySharpSensorDescription(
         key="mac_address",
         translation_key="mac_address",
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=lambda data: (data.get(DATA_DEVICE_INFO) or {}).get("mac_addr"),
+        value_fn=_section_getter(DATA_DEVICE_INFO, "mac_addr"),
     ),
     RaySharpSensorDescription(
         key="total_channels",
         translation_key="total_channels",
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=lambda data: (data.get(DATA_DEVICE_INFO) or {}).get("channel_num"),
+        value_fn=_section_getter(DATA_DEVICE_INFO, "channel_num"),
     ),
     RaySharpSensorDescription(
         key="cloud_state",
         translation_key="cloud_state",
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=lambda data: (data.get(DATA_SYSTEM_INFO) or {}).get("network_state"),
+        value_fn=_section_getter(DATA_SYSTEM_INFO, "network_state"),
     ),
     RaySharpSensorDescription(
         key="device_datetime",
         translation_key="device_datetime",
         entity_category=EntityCategory.DIAGNOSTIC,
         device_class=SensorDeviceClass.TIMESTAMP,
-        value_fn=lambda data: (data.get(DATA_DATE_TIME) or {}).get("date_time"),
-        exists_fn=lambda data: data.get(DATA_DATE_TIME) is not None,
+        value_fn=_section_getter(DATA_DATE_TIME, "date_time"),
+        exists_key=DATA_DATE_TIME,
     ),
 )
 
@@ -116,38 +164,38 @@ SYSTEM_INFO_SENSORS: tuple[RaySharpSensorDescription, ...] = (
         key="system_hw_version",
         translation_key="system_hw_version",
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=lambda data: (data.get(DATA_SYSTEM_INFO) or {}).get("hardware_version"),
-        exists_fn=lambda data: data.get(DATA_SYSTEM_INFO) is not None,
+        value_fn=_section_getter(DATA_SYSTEM_INFO, "hardware_version"),
+        exists_key=DATA_SYSTEM_INFO,
     ),
     RaySharpSensorDescription(
         key="system_serial",
         translation_key="system_serial",
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=lambda data: (data.get(DATA_SYSTEM_INFO) or {}).get("serialNum"),
-        exists_fn=lambda data: data.get(DATA_SYSTEM_INFO) is not None,
+        value_fn=_section_getter(DATA_SYSTEM_INFO, "serialNum"),
+        exists_key=DATA_SYSTEM_INFO,
     ),
     RaySharpSensorDescription(
         key="system_model",
         translation_key="system_model",
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=lambda data: (data.get(DATA_SYSTEM_INFO) or {}).get("device_name"),
-        exists_fn=lambda data: data.get(DATA_SYSTEM_INFO) is not None,
+        value_fn=_section_getter(DATA_SYSTEM_INFO, "device_name"),
+        exists_key=DATA_SYSTEM_INFO,
     ),
     RaySharpSensorDescription(
         key="system_alarm_inputs",
         translation_key="system_alarm_inputs",
         entity_category=EntityCategory.DIAGNOSTIC,
         state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda data: (data.get(DATA_DEVICE_INFO) or {}).get("local_alarmin_num"),
-        exists_fn=lambda data: data.get(DATA_DEVICE_INFO) is not None,
+        value_fn=_section_getter(DATA_DEVICE_INFO, "local_alarmin_num"),
+        exists_key=DATA_DEVICE_INFO,
     ),
     RaySharpSensorDescription(
         key="system_alarm_outputs",
         translation_key="system_alarm_outputs",
         entity_category=EntityCategory.DIAGNOSTIC,
         state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda data: (data.get(DATA_DEVICE_INFO) or {}).get("local_alarmout_num"),
-        exists_fn=lambda data: data.get(DATA_DEVICE_INFO) is not None,
+        value_fn=_section_getter(DATA_DEVICE_INFO, "local_alarmout_num"),
+        exists_key=DATA_DEVICE_INFO,
     ),
 )
 
@@ -192,29 +240,29 @@ AI_SENSORS: tuple[RaySharpSensorDescription, ...] = (
         key="ai_faces_detected",
         translation_key="ai_faces_detected",
         state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda data: _get_vhd_count(data, 0),  # face
-        exists_fn=lambda data: data.get(DATA_AI_VHD_COUNT) is not None,
+        value_fn=_vhd_count_getter(0),  # face
+        exists_key=DATA_AI_VHD_COUNT,
     ),
     RaySharpSensorDescription(
         key="ai_plates_detected",
         translation_key="ai_plates_detected",
         state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda data: _get_vhd_count(data, 3),  # plate (index 3)
-        exists_fn=lambda data: data.get(DATA_AI_VHD_COUNT) is not None,
+        value_fn=_vhd_count_getter(3),  # plate (index 3)
+        exists_key=DATA_AI_VHD_COUNT,
     ),
     RaySharpSensorDescription(
         key="ai_object_stats_person_total",
         translation_key="ai_object_stats_person_total",
         state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda data: _get_vhd_count(data, 1),  # person
-        exists_fn=lambda data: data.get(DATA_AI_VHD_COUNT) is not None,
+        value_fn=_vhd_count_getter(1),  # person
+        exists_key=DATA_AI_VHD_COUNT,
     ),
     RaySharpSensorDescription(
         key="ai_object_stats_vehicle_total",
         translation_key="ai_object_stats_vehicle_total",
         state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda data: _get_vhd_count(data, 2),  # vehicle
-        exists_fn=lambda data: data.get(DATA_AI_VHD_COUNT) is not None,
+        value_fn=_vhd_count_getter(2),  # vehicle
+        exists_key=DATA_AI_VHD_COUNT,
     ),
 )
 
@@ -225,7 +273,7 @@ EVENT_PUSH_SENSORS: tuple[RaySharpSensorDescription, ...] = (
         translation_key="event_push_status",
         entity_category=EntityCategory.DIAGNOSTIC,
         value_fn=lambda data: _get_event_push_status(data),
-        exists_fn=lambda data: data.get(DATA_EVENT_PUSH_CONFIG) is not None,
+        exists_key=DATA_EVENT_PUSH_CONFIG,
     ),
 )
 
@@ -236,10 +284,21 @@ EXCEPTION_SENSORS: tuple[RaySharpSensorDescription, ...] = (
         translation_key="exception_alarm_status",
         entity_category=EntityCategory.DIAGNOSTIC,
         value_fn=lambda data: _get_exception_status(data),
-        exists_fn=lambda data: data.get(DATA_EXCEPTION_ALARM) is not None,
+        exists_key=DATA_EXCEPTION_ALARM,
     ),
 )
 
+# All fixed sensor descriptions, checked against coordinator data at setup
+STATIC_SENSORS: tuple[RaySharpSensorDescription, ...] = (
+    DEVICE_INFO_SENSORS
+    + SYSTEM_INFO_SENSORS
+    + NETWORK_STATE_SENSORS
+    + RECORD_INFO_SENSORS
+    + AI_SENSORS
+    + EVENT_PUSH_SENSORS
+    + EXCEPTION_SENSORS
+)
+
 
 # ─── Helper functions ─────────────────────────────────────────────────────────
 
@@ -286,20 +345,36 @@ def _get_exception_status(data: dict[str, Any]) -> str | None:
     return ", ".join(enabled)
 
 
+# Top-level IP field names, in order of preference
+_IP_FIELDS = ("ip", "ip_addr", "IP", "ip_address")
+
+
 def _get_network_ip(data: dict[str, Any]) -> str | None:
     """Extract IP address from network state or config."""
     for key in (DATA_NETWORK_STATE, DATA_NETWORK_CONFIG):
         net = data.get(key)
         if not isinstance(net, dict):
             continue
-        ip = (
-            net.get("ip")
-            or net.get("ip_addr")
-            or net.get("IP")
-            or net.get("ip_address")
-            or _search_nested(net, "ip")
-            or _search_nested(net, "ip_address")
-        )
+        for field in _IP_FIELDS:
+            ip = net.get(field)
+            if ip:
+                return str(ip)
+        # One pass over nested sections, preferring the first "ip" found
+        # over the first "ip_address".  A key present (but empty) at the top
+        # level shadows the nested ones, as a shallow search would.
+        if "ip" in net and "ip_address" in net:
+            continue
+        nested_ip = nested_ip_address = None
+        for sub in net.values():
+            if not isinstance(sub, dict):
+                continue
+            if nested_ip is None and "ip" not in net:
+                nested_ip = sub.get("ip")
+                if nested_ip:
+                    break
+            if nested_ip_address is None and "ip_address" not in net:
+                nested_ip_address = sub.get("ip_address")
+        ip = nested_ip or nested_ip_address
         if ip:
             return str(ip)
     return None
@@ -331,29 +406,11 @@ def _search_nested(obj: Any, field: str) -> Any:
     return None
 
 
-def _get_channel_list_for_sensors(data: dict[str, Any]) -> list[dict[str, Any]]:
-    """Extract channel list from coordinator data."""
-    channel_data = data.get(DATA_CHANNEL_INFO)
-    if not channel_data:
-        return []
-    if isinstance(channel_data, dict):
-        channels = channel_data.get("channel_param", {}).get("items", [])
-        if not channels:
-            channels = channel_data.get("channels", channel_data.get("channel", []))
-    elif isinstance(channel_data, list):
-        channels = channel_data
-    else:
-        return []
-    if not isinstance(channels, list):
-        channels = [channels]
-    return channels
-
-
 def _get_cc_stats_for_channel(
-    data: dict[str, Any], channel_index: int, key: str
+    coordinator: RaySharpNVRCoordinator, channel_index: int, key: str
 ) -> int | None:
     """Get cross-counting statistics for a specific channel."""
-    cc_data = data.get(DATA_AI_CC_STATS)
+    cc_data = coordinator.data.get(DATA_AI_CC_STATS)
     if cc_data is None:
         return None
     if isinstance(cc_data, dict):
@@ -380,60 +437,41 @@ def _has_ai_capability(channel: dict[str, Any]) -> bool:
 
 
 def _build_cc_stats_sensors(
-    data: dict[str, Any],
-) -> list[RaySharpSensorDescription]:
+    data: dict[str, Any], channels: list[dict[str, Any]]
+) -> list[RaySharpIndexedSensorDescription]:
     """Build per-channel cross-counting sensors for AI-capable channels."""
     if data.get(DATA_AI_CC_STATS) is None:
         return []
 
-    channels = _get_channel_list_for_sensors(data)
-    sensors: list[RaySharpSensorDescription] = []
+    sensors: list[RaySharpIndexedSensorDescription] = []
 
     for i, channel in enumerate(channels):
         if not _has_ai_capability(channel):
             continue
         channel_num = i + 1
         sensors.append(
-            RaySharpSensorDescription(
+            RaySharpIndexedSensorDescription(
                 key=f"ai_cross_count_in_ch{channel_num}",
                 translation_key="ai_cross_count_in_channel",
                 state_class=SensorStateClass.TOTAL_INCREASING,
-                value_fn=lambda data, idx=i: _get_cc_stats_for_channel(
-                    data, idx, "in_count"
-                ),
+                index=i,
+                field="in_count",
+                indexed_value_fn=_get_cc_stats_for_channel,
             )
         )
         sensors.append(
-            RaySharpSensorDescription(
+            RaySharpIndexedSensorDescription(
                 key=f"ai_cross_count_out_ch{channel_num}",
                 translation_key="ai_cross_count_out_channel",
                 state_class=SensorStateClass.TOTAL_INCREASING,
-                value_fn=lambda data, idx=i: _get_cc_stats_for_channel(
-                    data, idx, "out_count"
-                ),
+                index=i,
+                field="out_count",
+                indexed_value_fn=_get_cc_stats_for_channel,
             )
         )
     return sensors
 
 
-def _get_vhd_count(data: dict[str, Any], type_index: int) -> int | None:
-    """Return today's AI count for a type from VhdLogCount response.
-
-    The request is made with Type=[0=face, 1=person, 2=vehicle, 10=plate],
-    so the Count array indices are: 0→face, 1→person, 2→vehicle, 3→plate.
-    """
-    vhd = data.get(DATA_AI_VHD_COUNT)
-    if not isinstance(vhd, dict):
-        return None
-    count = vhd.get("Count")
-    if isinstance(count, list) and type_index < len(count):
-        try:
-            return int(count[type_index])
-        except (TypeError, ValueError):
-            return None
-    return None
-
-
 def _count_items(data: Any) -> int | None:
     """Count items in a list or return count from data."""
     if data is None:
@@ -490,105 +528,69 @@ def _get_object_stats(stats_data: Any, obj_type: str) -> int | None:
     return None
 
 
-def _build_disk_sensors(data: dict[str, Any]) -> list[RaySharpSensorDescription]:
+def _build_disk_sensors(
+    disk_list: list[dict[str, Any]],
+) -> list[RaySharpIndexedSensorDescription]:
     """Build dynamic sensor descriptions for each disk."""
-    disk_data = data.get(DATA_DISK_CONFIG)
-    if not disk_data:
-        return []
-
-    if isinstance(disk_data, dict):
-        disk_list = disk_data.get("disk_info", disk_data.get("disks", disk_data.get("disk", [])))
-    elif isinstance(disk_data, list):
-        disk_list = disk_data
-    else:
-        return []
-
-    if not isinstance(disk_list, list):
-        disk_list = [disk_list]
-
-    sensors: list[RaySharpSensorDescription] = []
+    sensors: list[RaySharpIndexedSensorDescription] = []
     for i, _ in enumerate(disk_list):
         disk_num = i + 1
         sensors.extend(
             [
-                RaySharpSensorDescription(
+                RaySharpIndexedSensorDescription(
                     key=f"disk_{disk_num}_capacity",
                     translation_key="disk_capacity",
                     native_unit_of_measurement=UnitOfInformation.GIGABYTES,
                     state_class=SensorStateClass.MEASUREMENT,
                     entity_category=EntityCategory.DIAGNOSTIC,
-                    value_fn=lambda data, idx=i: _get_disk_value(
-                        data, idx, "total_space"
-                    ),
+                    index=i,
+                    field="total_space",
+                    indexed_value_fn=_get_disk_value,
                 ),
-                RaySharpSensorDescription(
+                RaySharpIndexedSensorDescription(
                     key=f"disk_{disk_num}_used",
                     translation_key="disk_used",
                     native_unit_of_measurement=UnitOfInformation.GIGABYTES,
                     state_class=SensorStateClass.MEASUREMENT,
                     entity_category=EntityCategory.DIAGNOSTIC,
-                    value_fn=lambda data, idx=i: _get_disk_value(
-                        data, idx, "used_space"
-                    ),
+                    index=i,
+                    field="used_space",
+                    indexed_value_fn=_get_disk_value,
                 ),
-                RaySharpSensorDescription(
+                RaySharpIndexedSensorDescription(
                     key=f"disk_{disk_num}_free",
                     translation_key="disk_free",
                     native_unit_of_measurement=UnitOfInformation.GIGABYTES,
                     state_class=SensorStateClass.MEASUREMENT,
                     entity_category=EntityCategory.DIAGNOSTIC,
-                    value_fn=lambda data, idx=i: _get_disk_value(
-                        data, idx, "free_space"
-                    ),
+                    index=i,
+                    field="free_space",
+                    indexed_value_fn=_get_disk_value,
                 ),
-                RaySharpSensorDescription(
+                RaySharpIndexedSensorDescription(
                     key=f"disk_{disk_num}_status",
                     translation_key="disk_status",
                     entity_category=EntityCategory.DIAGNOSTIC,
-                    value_fn=lambda data, idx=i: _get_disk_value(
-                        data, idx, "status"
-                    ),
+                    index=i,
+                    field="status",
+                    indexed_value_fn=_get_disk_value,
                 ),
             ]
         )
     return sensors
 
 
-def _get_disk_list(data: dict[str, Any]) -> list:
-    """Extract disk list from data."""
-    disk_data = data.get(DATA_DISK_CONFIG)
-    if not disk_data:
-        return []
-    if isinstance(disk_data, dict):
-        disk_list = disk_data.get("disk_info", disk_data.get("disks", disk_data.get("disk", [])))
-    elif isinstance(disk_data, list):
-        disk_list = disk_data
-    else:
-        return []
-    if not isinstance(disk_list, list):
-        disk_list = [disk_list]
-    return disk_list
-
-
-def _get_disk_value(data: dict[str, Any], index: int, key: str) -> Any:
-    """Get a disk value by index and key, converting MB to GB where needed."""
-    disk_list = _get_disk_list(data)
+def _get_disk_value(
+    coordinator: RaySharpNVRCoordinator, index: int, key: str
+) -> Any:
+    """Get a disk value by index and key, sizes converted from MB to GB."""
+    disk_list = coordinator.disks
     if index >= len(disk_list):
         return None
-    disk = disk_list[index]
-    if key == "total_space":
-        mb = disk.get("total_size")
-        return round(mb / 1024, 1) if mb is not None else None
-    if key == "free_space":
-        mb = disk.get("free_size")
-        return round(mb / 1024, 1) if mb is not None else None
-    if key == "used_space":
-        total_mb = disk.get("total_size")
-        free_mb = disk.get("free_size")
-        if total_mb is not None and free_mb is not None:
-            return round((total_mb - free_mb) / 1024, 1)
-        return None
-    return disk.get(key)
+    gb = coordinator.disk_sizes_gb[index]
+    if key in gb:
+        return gb[key]
+    return disk_list[index].get(key)
 
 
 # ─── Setup ────────────────────────────────────────────────────────────────────
@@ -600,34 +602,31 @@ async def async_setup_entry(
 ) -> None:
     """Set up RaySharp NVR sensors."""
     coordinator: RaySharpNVRCoordinator = hass.data[DOMAIN][entry.entry_id]
-    entities: list[RaySharpSensor] = []
-
-    for description in (
-        DEVICE_INFO_SENSORS
-        + SYSTEM_INFO_SENSORS
-        + NETWORK_STATE_SENSORS
-        + RECORD_INFO_SENSORS
-        + AI_SENSORS
-        + EVENT_PUSH_SENSORS
-        + EXCEPTION_SENSORS
-    ):
-        if description.exists_fn(coordinator.data):
-            entities.append(RaySharpSensor(coordinator, description))
+    data = coordinator.data
+    entities: list[SensorEntity] = [
+        RaySharpSensor(coordinator, description)
+        for description in STATIC_SENSORS
+        if (
+            data.get(description.exists_key) is not None
+            if description.exists_key is not None
+            else description.exists_fn(data)
+        )
+    ]
 
     # Per-channel cross-counting sensors
-    for description in _build_cc_stats_sensors(coordinator.data):
-        entities.append(RaySharpSensor(coordinator, description))
+    for description in _build_cc_stats_sensors(coordinator.data, coordinator.channels):
+        entities.append(RaySharpIndexedSensor(coordinator, description))
 
     # Dynamic disk sensors
-    for description in _build_disk_sensors(coordinator.data):
-        entities.append(RaySharpSensor(coordinator, description))
+    for description in _build_disk_sensors(coordinator.disks):
+        entities.append(RaySharpIndexedSensor(coordinator, description))
 
     # Event-accumulator sensors with persistent storage
     mac = (coordinator.data.get(DATA_DEVICE_INFO, {}) or {}).get("mac_addr", "unknown")
     plates_sensor = RaySharpPlatesTrackerSensor(coordinator, mac, entry.entry_id)
     faces_sensor = RaySharpFacesTrackerSensor(coordinator, mac, entry.entry_id)
-    entities.append(plates_sensor)  # type: ignore[arg-type]
-    entities.append(faces_sensor)  # type: ignore[arg-type]
+    entities.append(plates_sensor)
+    entities.append(faces_sensor)
 
     # Store tracker references so the clear_detections_history service can find them
     hass.data.setdefault(DOMAIN_TRACKERS, {})[entry.entry_id] = {
@@ -644,21 +643,39 @@ async def async_setup_entry(
 # Russian plates officially use only these 12 Cyrillic characters.
 # Some NVR firmware or OCR engines return them in Latin; normalise to Latin
 # so plate comparison is consistent regardless of the source encoding.
+# The table also uppercases ASCII, so a plate that is ASCII after the
+# translation needs no separate .upper() pass.
 _PLATE_CYR_TO_LAT = str.maketrans(
-    "АВЕКМНОРСТУХавекмнорстух",
-    "ABEKMHOPCTYXabekmhopctyx",
+    "АВЕКМНОРСТУХавекмнорстух" + string.ascii_lowercase,
+    "ABEKMHOPCTYXABEKMHOPCTYX" + string.ascii_uppercase,
 )
 
 # Maximum gap (seconds) between two events of the *same* plate that are
 # treated as a single detection (deduplication window).
 _PLATE_DEDUP_SECS = 60
 
+# Window (seconds) for collecting plates into one database lookup request
+_PLATE_ENRICH_DELAY = 0.25
+
+# How long (seconds) cached plate database records are trusted before
+# lookups go back to the NVR, so edits to its allow/block lists show up
+_PLATE_INFO_TTL = 600
+
+# Entry fields a plate database lookup may fill in
+_PLATE_ENRICH_FIELDS = ("list_type", "list_type_label", "car_brand", "owner", "grp_id")
 
+
+# The dedup scan re-normalises every stored plate inside the window on each
+# event; plates recur, so memoise the result.
+@lru_cache(maxsize=1024)
 def _normalize_plate(text: str) -> str:
     """Normalise plate text: translate Cyrillic look-alikes → Latin, uppercase."""
     if not text:
         return ""
-    return text.translate(_PLATE_CYR_TO_LAT).upper()
+    normalized = text.translate(_PLATE_CYR_TO_LAT)
+    if normalized.isascii():
+        return normalized
+    return normalized.upper()
 
 
 def _plates_are_same(p1: str, p2: str, min_common: int = 3) -> bool:
@@ -679,8 +696,37 @@ def _plates_are_same(p1: str, p2: str, min_common: int = 3) -> bool:
         return False
     if short in long_:
         return True
-    matches = sum(c1 == c2 for c1, c2 in zip(p1, p2))
-    return matches >= min_common
+    return _count_positional_matches(p1, p2) >= min_common
+
+
+@lru_cache(maxsize=32)
+def _byte_masks(n: int) -> tuple[int, int]:
+    """Return (0x7F.., 0x80..) masks spanning *n* bytes."""
+    return int.from_bytes(b"\x7f" * n, "big"), int.from_bytes(b"\x80" * n, "big")
+
+
+def _count_positional_matches(p1: str, p2: str) -> int:
+    """Count indices at which two plate strings hold the same character.
+
+    ASCII plates (the common case after normalisation) are compared as one
+    big integer each: XOR leaves a zero byte at every matching position, and
+    the zero bytes are counted with a carry-free SWAR test and a popcount
+    instead of a per-character Python loop.
+    """
+    n = min(len(p1), len(p2))
+    if not (p1.isascii() and p2.isascii()):
+        return sum(c1 == c2 for c1, c2 in zip(p1, p2))
+    x = int.from_bytes(p1[:n].encode(), "big") ^ int.from_bytes(
+        p2[:n].encode(), "big"
+    )
+    low7, high = _byte_masks(n)
+    # High bit of each byte is set iff that byte of x is non-zero
+    nonzero = (((x & low7) + low7) | x) & high
+    return n - nonzero.bit_count()
+
+
+# List types by face-group policy code (plate GrpId is the same order, 1-based)
+_FACE_POLICY_LIST_TYPES = ("allowed", "blocked", "stranger")
 
 
 def _grp_id_to_list_type(grp_id: Any) -> str:
@@ -691,11 +737,41 @@ def _grp_id_to_list_type(grp_id: Any) -> str:
       1 = Block list (Запрещённые / Черный список)
       2 = Stranger / Unknown (Незнакомец / Неизвестно)
     """
-    try:
-        code = int(grp_id)
-    except (TypeError, ValueError):
-        return "unknown"
-    return {0: "allowed", 1: "blocked", 2: "stranger"}.get(code, "known")
+    if type(grp_id) is not int:
+        try:
+            grp_id = int(grp_id)
+        except (TypeError, ValueError):
+            return "unknown"
+    return _FACE_POLICY_LIST_TYPES[grp_id] if 0 <= grp_id < 3 else "known"
+
+
+def _resolve_face_group(
+    grp_id: Any, group: dict[str, Any]
+) -> tuple[str, str, str]:
+    """Return (list_type, list_type_label, name) for a face group.
+
+    Without a known group definition the id itself is taken as the policy.
+    """
+    list_type = _grp_id_to_list_type(group.get("policy", grp_id))
+    return (
+        list_type,
+        _LIST_TYPE_LABEL.get(list_type, list_type),
+        group.get("name", ""),
+    )
+
+
+def _apply_plate_info(entry: dict[str, Any], info: dict[str, Any] | None) -> None:
+    """Fill a plate entry from its plate database record (None = not listed)."""
+    if info is not None:
+        entry.setdefault("car_brand", info.get("CarBrand", ""))
+        entry.setdefault("owner", info.get("Owner", ""))
+        grp_id = info.get("GrpId")
+        entry["grp_id"] = grp_id
+        list_type = _plate_grp_id_to_list_type(grp_id)
+    else:
+        list_type = "unknown"
+    entry["list_type"] = list_type
+    entry["list_type_label"] = _LIST_TYPE_LABEL.get(list_type, list_type)
 
 
 def _plate_grp_id_to_list_type(grp_id: Any) -> str:
@@ -706,11 +782,26 @@ def _plate_grp_id_to_list_type(grp_id: Any) -> str:
       2 = Черный список (Block list)
       3 = Неизвестно    (Stranger / Unknown)
     """
+    if type(grp_id) is not int:
+        try:
+            grp_id = int(grp_id)
+        except (TypeError, ValueError):
+            return "unknown"
+    return _FACE_POLICY_LIST_TYPES[grp_id - 1] if 1 <= grp_id <= 3 else "known"
+
+
+def _entry_epoch(entry: dict[str, Any]) -> float:
+    """Return a tracker entry's local ISO timestamp as POSIX seconds."""
     try:
-        code = int(grp_id)
-    except (TypeError, ValueError):
-        return "unknown"
-    return {1: "allowed", 2: "blocked", 3: "stranger"}.get(code, "known")
+        return datetime.fromisoformat(entry["timestamp"]).timestamp()
+    except (KeyError, TypeError, ValueError):
+        return 0.0
+
+
+def _entry_time_fields(now: datetime) -> tuple[str, str]:
+    """Return *now* as (ISO timestamp, "YYYY-MM-DD HH:MM:SS"), formatted once."""
+    iso = now.isoformat()
+    return iso, f"{iso[:10]} {iso[11:19]}"
 
 
 _LIST_TYPE_LABEL: dict[str, str] = {
@@ -732,9 +823,21 @@ class _BaseTrackerSensor(RaySharpEntity, SensorEntity):
     Use the clear_detections_history service to wipe stored data.
     """
 
+    __slots__ = (
+        "_entry_id",
+        "_entries",
+        "_timestamps",
+        "_column",
+        "_version",
+        "_attrs_cache",
+        "_store",
+    )
+
     _MAX_ENTRIES = 5000
     _store_key: str  # override in subclass
     _alarm_type: str  # override in subclass
+    # Entry field also kept as a parallel column for window scans (optional)
+    _column_field: str | None = None
 
     def __init__(
         self,
@@ -745,19 +848,58 @@ class _BaseTrackerSensor(RaySharpEntity, SensorEntity):
         """Initialize the tracker sensor."""
         super().__init__(coordinator)
         self._entry_id = entry_id
+        # Entries in timestamp order, with their epoch times in a parallel
+        # packed array (8 bytes each) for bisecting time windows
         self._entries: list[dict[str, Any]] = []
+        self._timestamps: array[float] = array("d")
+        # _column_field of each entry, so scans skip the per-row dict lookup
+        self._column: list[Any] = []
+        # Bumped whenever _entries changes.  Together with the index where
+        # the 24 h window starts it identifies the window's contents, so the
+        # attributes are rebuilt only when an entry arrives or one expires.
+        self._version = 0
+        # version, window start index, attributes
+        self._attrs_cache: tuple[int, int, dict[str, Any]] = (-1, -1, {})
         self._store: Store | None = None
-        self._save_unsub: Any = None
         self._attr_state_class = SensorStateClass.MEASUREMENT
         self._attr_entity_category = EntityCategory.DIAGNOSTIC
 
-    def _cutoff(self, hours: int = 24) -> str:
-        return (datetime.now() - timedelta(hours=hours)).isoformat()
+    def _cutoff(self, hours: int = 24) -> float:
+        return time.time() - hours * 3600
 
     @property
     def native_value(self) -> int:
         """Count of events in the last 24 h."""
-        return sum(1 for e in self._entries if e.get("timestamp", "") >= self._cutoff(24))
+        timestamps = self._timestamps
+        return len(timestamps) - bisect_left(timestamps, self._cutoff(24))
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return attributes for the last 24 h.
+
+        The window slice and the attributes built from it are reused until
+        an entry is added or the oldest one in the window expires.
+        """
+        cutoff = self._cutoff(24)
+        start = bisect_left(self._timestamps, cutoff)
+        version, cached_start, attrs = self._attrs_cache
+        if version == self._version and cached_start == start:
+            return attrs
+        attrs = self._build_attributes(self._entries[start:], cutoff)
+        attrs["total_stored"] = len(self._entries)
+        self._attrs_cache = (self._version, start, attrs)
+        return attrs
+
+    def _build_attributes(
+        self, recent: list[dict[str, Any]], cutoff: float
+    ) -> dict[str, Any]:
+        """Return the subclass-specific attributes for the 24 h window.
+
+        *recent* holds the window's entries, oldest first, and *cutoff* is
+        the epoch time the window starts at.  Return a new dict; the base
+        class adds "total_stored" and caches it until the window changes.
+        """
+        raise NotImplementedError
 
     async def async_added_to_hass(self) -> None:
         """Load persisted data and subscribe to events."""
@@ -770,52 +912,99 @@ class _BaseTrackerSensor(RaySharpEntity, SensorEntity):
         )
         stored = await self._store.async_load()
         if isinstance(stored, dict):
-            self._entries = stored.get("entries", [])
+            entries = stored.get("entries", [])
+            # Stored entries only carry the ISO string; parse each once
+            timed = sorted(
+                ((_entry_epoch(e), e) for e in entries), key=lambda item: item[0]
+            )
+            self._timestamps = array("d", [ts for ts, _ in timed])
+            self._entries = [e for _, e in timed]
+            if self._column_field is not None:
+                self._column = [e.get(self._column_field) for e in self._entries]
         # Prune entries older than STORAGE_KEEP_DAYS on load
-        cutoff = self._cutoff(STORAGE_KEEP_DAYS * 24)
-        self._entries = [e for e in self._entries if e.get("timestamp", "") >= cutoff]
+        self._prune()
+        self._version += 1
         self.async_write_ha_state()
 
         self.async_on_remove(
             self.hass.bus.async_listen(EVENT_SNAPSHOT, self._handle_snapshot)
         )
 
-    async def async_will_remove_from_hass(self) -> None:
-        """Cancel a pending debounced save before removal."""
-        if self._save_unsub:
-            self._save_unsub()
-            self._save_unsub = None
-
     @callback
     def _schedule_save(self) -> None:
-        """Debounce: save to storage at most every STORAGE_SAVE_DELAY seconds."""
-        if self._save_unsub:
-            self._save_unsub()
-        self._save_unsub = async_call_later(
-            self.hass, STORAGE_SAVE_DELAY, self._do_save
-        )
+        """Debounce: save to storage at most every STORAGE_SAVE_DELAY seconds.
 
-    @callback
-    def _do_save(self, _now: Any) -> None:
-        self._save_unsub = None
+        HA's delayed save collects and serialises the entries (with its
+        orjson-based encoder) only when the write runs, and flushes a pending
+        write on shutdown.
+        """
         if self._store:
-            self.hass.async_create_task(
-                self._store.async_save({"entries": self._entries})
-            )
+            self._store.async_delay_save(self._data_to_save, STORAGE_SAVE_DELAY)
 
-    def _append_entry(self, entry: dict[str, Any]) -> None:
-        """Add entry, prune old data, cap size, schedule save."""
-        self._entries.append(entry)
-        cutoff = self._cutoff(STORAGE_KEEP_DAYS * 24)
-        self._entries = [e for e in self._entries if e.get("timestamp", "") >= cutoff]
-        if len(self._entries) > self._MAX_ENTRIES:
-            self._entries = self._entries[-self._MAX_ENTRIES:]
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        # Hand the writer a snapshot: the live list keeps changing on the
+        # event loop while the payload is encoded and written.
+        return {"entries": self._entries[:]}
+
+    def _prune(self) -> None:
+        """Drop entries older than STORAGE_KEEP_DAYS and cap the size."""
+        idx = bisect_left(self._timestamps, self._cutoff(STORAGE_KEEP_DAYS * 24))
+        idx = max(idx, len(self._entries) - self._MAX_ENTRIES)
+        if idx > 0:
+            del self._entries[:idx]
+            del self._timestamps[:idx]
+            del self._column[:idx]
+
+    def _append_entry(
+        self, entry: dict[str, Any], timestamp: float | None = None
+    ) -> None:
+        """Add entry, prune old data, cap size, schedule save.
+
+        Callers that already hold the entry's epoch time pass it as
+        *timestamp* to skip reparsing the ISO string.
+        """
+        if timestamp is None:
+            timestamp = _entry_epoch(entry)
+        self._insert_entry(entry, timestamp)
+        self._version += 1
         self.async_write_ha_state()
         self._schedule_save()
 
+    def _insert_entry(self, entry: dict[str, Any], timestamp: float) -> None:
+        """Insert entry in time order, pruning old data and capping size.
+
+        Subclasses extend this to keep derived state in step; it runs before
+        the new state is written.
+        """
+        timestamps = self._timestamps
+        field = self._column_field
+        if not timestamps or timestamp >= timestamps[-1]:
+            self._entries.append(entry)
+            timestamps.append(timestamp)
+            if field is not None:
+                self._column.append(entry.get(field))
+        else:
+            # Wall clock stepped back; keep all columns ordered
+            idx = bisect_right(timestamps, timestamp)
+            self._entries.insert(idx, entry)
+            timestamps.insert(idx, timestamp)
+            if field is not None:
+                self._column.insert(idx, entry.get(field))
+        # Only bisect and delete when the oldest entry has expired or the
+        # size cap is exceeded
+        if (
+            len(self._entries) > self._MAX_ENTRIES
+            or timestamps[0] < self._cutoff(STORAGE_KEEP_DAYS * 24)
+        ):
+            self._prune()
+
     async def async_clear(self) -> None:
         """Clear all stored entries and persist the empty state."""
         self._entries = []
+        self._timestamps = array("d")
+        self._column = []
+        self._version += 1
         if self._store:
             await self._store.async_save({"entries": []})
         self.async_write_ha_state()
@@ -837,8 +1026,20 @@ class RaySharpPlatesTrackerSensor(_BaseTrackerSensor):
       total_stored  — total entries across all stored days
     """
 
+    __slots__ = (
+        "_recent_plates",
+        "_pending_enrich",
+        "_enrich_unsub",
+        "_known_plates",
+        "_known_plates_expiry",
+        "_known_plates_seeded",
+        "_unique_counts",
+        "_unique_since",
+    )
+
     _store_key = STORAGE_KEY_PLATES
     _alarm_type = ALARM_TYPE_PLATE
+    _column_field = "plate_number"
 
     def __init__(
         self, coordinator: RaySharpNVRCoordinator, mac: str, entry_id: str
@@ -846,19 +1047,112 @@ class RaySharpPlatesTrackerSensor(_BaseTrackerSensor):
         super().__init__(coordinator, mac, entry_id)
         self._attr_unique_id = f"{mac}_plates_tracker"
         self._attr_name = "Plates Detected Today"
+        # Normalised plates stored within the dedup window → epoch last stored,
+        # oldest first, so expiry pops from the front
+        self._recent_plates: OrderedDict[str, float] = OrderedDict()
+        # Plate → entries awaiting a database lookup, flushed as one request
+        self._pending_enrich: dict[str, list[dict[str, Any]]] = {}
+        self._enrich_unsub: Callable[[], None] | None = None
+        # Normalised plate → plate database record, seeded once the
+        # coordinator's background prefetch has landed and extended by batched
+        # lookups; dropped wholesale at _known_plates_expiry (monotonic)
+        self._known_plates: dict[str, dict[str, Any]] = {}
+        self._known_plates_expiry = 0.0
+        self._known_plates_seeded = False
+        # Plate → occurrences since _unique_since, ordered by first seen.
+        # Maintained as entries arrive and the window slides; None means the
+        # counts must be rebuilt from _entries.
+        self._unique_counts: OrderedDict[str, int] = OrderedDict()
+        self._unique_since: float | None = None
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        cutoff = self._cutoff(24)
-        recent = [e for e in self._entries if e.get("timestamp", "") >= cutoff]
-        unique_plates = list(dict.fromkeys(
-            e["plate_number"] for e in recent if e.get("plate_number")
-        ))
+    async def async_added_to_hass(self) -> None:
+        """Load persisted data and seed the dedup window from it."""
+        await super().async_added_to_hass()
+        start = bisect_left(self._timestamps, time.time() - _PLATE_DEDUP_SECS)
+        for ts, plate in zip(self._timestamps[start:], self._column[start:]):
+            self._remember_plate(plate or "", ts)
+
+    def _remember_plate(self, plate: str, ts: float) -> None:
+        if not plate:
+            return
+        plate_norm = _normalize_plate(plate)
+        self._recent_plates[plate_norm] = ts
+        self._recent_plates.move_to_end(plate_norm)
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Cancel a pending enrichment flush."""
+        if self._enrich_unsub is not None:
+            self._enrich_unsub()
+            self._enrich_unsub = None
+
+    async def async_clear(self) -> None:
+        """Clear all stored entries and the dedup window."""
+        self._recent_plates.clear()
+        self._unique_counts.clear()
+        self._unique_since = None
+        await super().async_clear()
+
+    def _insert_entry(self, entry: dict[str, Any], timestamp: float) -> None:
+        """Insert entry and count its plate into the unique-plates window."""
+        since = self._unique_since
+        if (
+            since is not None
+            and len(self._entries) >= self._MAX_ENTRIES
+            and self._timestamps[0] >= since
+        ):
+            # The size cap is about to drop an entry inside the window
+            self._unique_since = since = None
+        super()._insert_entry(entry, timestamp)
+        if since is None:
+            return
+        if self._entries[-1] is not entry:
+            # Inserted out of order (clock stepped back); first-seen order
+            # can no longer be maintained by appending
+            self._unique_since = None
+            return
+        plate = self._column[-1]
+        if plate and self._timestamps[-1] >= since:
+            counts = self._unique_counts
+            counts[plate] = counts.get(plate, 0) + 1
+
+    def _unique_plates(self, cutoff: float) -> list[str]:
+        """Return unique plates seen since *cutoff*, ordered by first seen.
+
+        Slides the counted window forward over the entries that expired
+        since the last call, and only rescans the window when an expiring
+        plate is still present later on (its first-seen position moves).
+        """
+        counts = self._unique_counts
+        timestamps = self._timestamps
+        since = self._unique_since
+        if since is not None and cutoff >= since:
+            start = bisect_left(timestamps, since)
+            end = bisect_left(timestamps, cutoff)
+            for plate in self._column[start:end]:
+                if not plate:
+                    continue
+                if counts[plate] > 1:
+                    since = None
+                    break
+                del counts[plate]
+        else:
+            since = None
+        if since is None:
+            counts.clear()
+            for plate in self._column[bisect_left(timestamps, cutoff):]:
+                if plate:
+                    counts[plate] = counts.get(plate, 0) + 1
+        self._unique_since = cutoff
+        return list(counts)
+
+    def _build_attributes(
+        self, recent: list[dict[str, Any]], cutoff: float
+    ) -> dict[str, Any]:
+        unique_plates = self._unique_plates(cutoff)
         return {
             "plates": recent,
             "unique_plates": unique_plates,
             "unique_count": len(unique_plates),
-            "total_stored": len(self._entries),
         }
 
     @callback
@@ -872,54 +1166,110 @@ class RaySharpPlatesTrackerSensor(_BaseTrackerSensor):
         now = datetime.now()
         # ── Deduplication: skip if same plate seen within the last window ──────
         plate_norm = _normalize_plate(plate)
-        dedup_cutoff = (now - timedelta(seconds=_PLATE_DEDUP_SECS)).isoformat()
-        for e in reversed(self._entries):
-            if e.get("timestamp", "") < dedup_cutoff:
-                break
-            if _plates_are_same(plate_norm, _normalize_plate(e.get("plate_number", ""))):
-                return  # Duplicate within dedup window, discard
+        now_ts = now.timestamp()
+        recent_plates = self._recent_plates
+        dedup_cutoff = now_ts - _PLATE_DEDUP_SECS
+        while recent_plates and next(iter(recent_plates.values())) < dedup_cutoff:
+            recent_plates.popitem(last=False)
+        if plate_norm in recent_plates:
+            return  # Duplicate within dedup window, discard
+        # Fuzzy match (OCR misreads, partial reads) against the distinct
+        # plates of the window only
+        for seen in recent_plates:
+            if _plates_are_same(plate_norm, seen):
+                return
         # ─────────────────────────────────────────────────────────────────────
+        iso, display_time = _entry_time_fields(now)
         entry: dict[str, Any] = {
             "plate_number": plate,
             "channel": data.get("channel", 0),
-            "timestamp": now.isoformat(),
-            "time": now.strftime("%Y-%m-%d %H:%M:%S"),
+            "timestamp": iso,
+            "time": display_time,
         }
         # Copy fields that might have arrived directly in the snapshot
         for field in ("car_brand", "car_type", "car_color", "grp_id"):
             if data.get(field) is not None:
                 entry[field] = data[field]
-        # Set list_type from grp_id if already known; otherwise enrich via API
+        # Set list_type from grp_id or a known database record if available;
+        # otherwise enrich via API
         if "grp_id" in entry:
             entry["list_type"] = _plate_grp_id_to_list_type(entry["grp_id"])
             entry["list_type_label"] = _LIST_TYPE_LABEL.get(entry["list_type"], entry["list_type"])
-        self._append_entry(entry)
+        elif (info := self._known_plate(plate_norm)) is not None:
+            _apply_plate_info(entry, info)
+        self._append_entry(entry, now_ts)
+        self._remember_plate(plate, now_ts)
         # Async DB enrichment to fill list_type / car_brand if not yet known
         if "list_type" not in entry:
-            self.hass.async_create_task(self._enrich_plate_entry(entry))
+            self._queue_enrich(entry)
+
+    def _known_plate(self, plate_norm: str) -> dict[str, Any] | None:
+        """Return the cached database record for a normalised plate, if any."""
+        known = self._known_plates
+        if (mono := time.monotonic()) >= self._known_plates_expiry:
+            known.clear()
+            self._known_plates_expiry = mono + _PLATE_INFO_TTL
+        if not self._known_plates_seeded and self.coordinator.known_plates:
+            # The prefetch has landed; records from later lookups are newer
+            self._known_plates_seeded = True
+            for info in self.coordinator.known_plates:
+                if info.get("Id"):
+                    known.setdefault(_normalize_plate(str(info["Id"])), info)
+        return known.get(plate_norm)
 
-    async def _enrich_plate_entry(self, entry: dict[str, Any]) -> None:
-        """Look up a plate in the NVR database and enrich the entry in-place."""
-        plate = entry.get("plate_number", "")
+    @callback
+    def _queue_enrich(self, entry: dict[str, Any]) -> None:
+        """Queue an entry for the next batched plate database lookup."""
+        self._pending_enrich.setdefault(entry["plate_number"], []).append(entry)
+        if self._enrich_unsub is None:
+            self._enrich_unsub = async_call_later(
+                self.hass, _PLATE_ENRICH_DELAY, self._flush_enrich
+            )
+
+    @callback
+    def _flush_enrich(self, _now: Any) -> None:
+        self._enrich_unsub = None
+        pending, self._pending_enrich = self._pending_enrich, {}
+        self.hass.async_create_task(self._enrich_plate_entries(pending))
+
+    async def _enrich_plate_entries(
+        self, pending: dict[str, list[dict[str, Any]]]
+    ) -> None:
+        """Look up queued plates in the NVR database, enriching entries in-place."""
+        plate_list: list[Any] = []
         try:
             resp = await self.coordinator.client.async_api_call(
-                API_AI_ADDED_PLATES_GET, {"PlatesId": [plate]}
+                API_AI_ADDED_PLATES_GET, {"PlatesId": list(pending)}
             )
             data = resp.get("data", resp) if isinstance(resp, dict) else {}
-            plate_list = data.get("PlateInfo", [])
-            if plate_list:
-                info = plate_list[0]
-                entry.setdefault("car_brand", info.get("CarBrand", ""))
-                entry.setdefault("owner", info.get("Owner", ""))
-                grp_id = info.get("GrpId")
-                entry["grp_id"] = grp_id
-                list_type = _plate_grp_id_to_list_type(grp_id)
-            else:
-                list_type = "unknown"
+            plate_list = data.get("PlateInfo", []) or []
         except (RaySharpNVRConnectionError, Exception):
-            list_type = "unknown"
-        entry["list_type"] = list_type
-        entry["list_type_label"] = _LIST_TYPE_LABEL.get(list_type, list_type)
+            pass
+        # Match results back by plate number (Id), normalised so Cyrillic and
+        # Latin spellings of the same plate agree
+        infos = {
+            _normalize_plate(str(info["Id"])): info
+            for info in plate_list
+            if isinstance(info, dict) and info.get("Id")
+        }
+        single = len(pending) == 1 and plate_list and isinstance(plate_list[0], dict)
+        changed = False
+        for plate, entries in pending.items():
+            info = infos.get(_normalize_plate(plate))
+            if info is None and single:
+                # Lone lookup: the first result is this plate's record
+                info = plate_list[0]
+            if info is not None:
+                self._known_plates[_normalize_plate(plate)] = info
+            for entry in entries:
+                before = tuple(map(entry.get, _PLATE_ENRICH_FIELDS))
+                _apply_plate_info(entry, info)
+                if tuple(map(entry.get, _PLATE_ENRICH_FIELDS)) != before:
+                    changed = True
+        # Nothing visible changed: spare the recorder row and the disk write
+        if not changed:
+            return
+        self._version += 1
         self.async_write_ha_state()
         self._schedule_save()
 
@@ -934,6 +1284,8 @@ class RaySharpFacesTrackerSensor(_BaseTrackerSensor):
       total_stored — total entries across all stored days
     """
 
+    __slots__ = ("_grp_resolve",)
+
     _store_key = STORAGE_KEY_FACES
     _alarm_type = ALARM_TYPE_FACE
 
@@ -943,51 +1295,30 @@ class RaySharpFacesTrackerSensor(_BaseTrackerSensor):
         super().__init__(coordinator, mac, entry_id)
         self._attr_unique_id = f"{mac}_faces_tracker"
         self._attr_name = "Faces Detected Today"
-        self._face_groups: dict[Any, dict] = {}  # group_id → {name, policy}
+        # group_id → (list_type, list_type_label, name), resolved on first use
+        # from the face groups the coordinator prefetches in the background
+        self._grp_resolve: dict[Any, tuple[str, str, str]] = {}
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        cutoff = self._cutoff(24)
-        recent = [e for e in self._entries if e.get("timestamp", "") >= cutoff]
+    def _build_attributes(
+        self, recent: list[dict[str, Any]], cutoff: float
+    ) -> dict[str, Any]:
         return {
             "detections": recent,
             "total_count": len(recent),
-            "total_stored": len(self._entries),
         }
 
-    async def async_added_to_hass(self) -> None:
-        """Load persisted data, fetch face groups, subscribe to events."""
-        await super().async_added_to_hass()
-        # Pre-cache face groups so we can resolve group policy instantly
-        self.hass.async_create_task(self._load_face_groups())
-
-    async def _load_face_groups(self) -> None:
-        """Fetch face group definitions from the NVR and cache them."""
-        try:
-            resp = await self.coordinator.client.async_api_call(API_AI_FD_GROUPS, {})
-            data = resp.get("data", resp) if isinstance(resp, dict) else {}
-            groups = data.get("group_info", data.get("groups", data.get("items", [])))
-            if isinstance(groups, list):
-                # Build {group_id: {"name": ..., "policy": 0/1/2}} mapping
-                self._face_groups = {
-                    g.get("group_id", g.get("id")): g
-                    for g in groups
-                    if isinstance(g, dict)
-                }
-        except Exception:
-            pass  # Groups stay empty — list_type will be set based on grp_id code
-
     @callback
     def _handle_snapshot(self, event: Any) -> None:
         data = event.data
         if data.get("alarm_type") != ALARM_TYPE_FACE:
             return
         now = datetime.now()
+        iso, display_time = _entry_time_fields(now)
         entry: dict[str, Any] = {
             "channel": data.get("channel", 0),
             "snap_id": data.get("snap_id"),
-            "timestamp": now.isoformat(),
-            "time": now.strftime("%Y-%m-%d %H:%M:%S"),
+            "timestamp": iso,
+            "time": display_time,
         }
         for field in ("face_id", "face_name", "grp_id", "similarity"):
             if data.get(field) is not None:
@@ -995,12 +1326,16 @@ class RaySharpFacesTrackerSensor(_BaseTrackerSensor):
 
         # Resolve list type immediately if grp_id is already available
         if "grp_id" in entry:
-            grp = self._face_groups.get(entry["grp_id"], {})
-            policy = grp.get("policy", entry["grp_id"])
-            list_type = _grp_id_to_list_type(policy)
-            entry["list_type"] = list_type
-            entry["list_type_label"] = _LIST_TYPE_LABEL.get(list_type, list_type)
-            entry.setdefault("face_name", grp.get("name", ""))
+            grp_id = entry["grp_id"]
+            resolved = self._grp_resolve.get(grp_id)
+            if resolved is None:
+                group = self.coordinator.face_groups.get(grp_id)
+                resolved = _resolve_face_group(grp_id, group or {})
+                # Groups not fetched yet are resolved again next time
+                if group is not None:
+                    self._grp_resolve[grp_id] = resolved
+            entry["list_type"], entry["list_type_label"], name = resolved
+            entry.setdefault("face_name", name)
         elif entry.get("face_id") is not None:
             # Recognised face but no group info yet — enrich async
             entry["list_type"] = "recognized"
@@ -1009,7 +1344,7 @@ class RaySharpFacesTrackerSensor(_BaseTrackerSensor):
             entry["list_type"] = "stranger"
             entry["list_type_label"] = _LIST_TYPE_LABEL["stranger"]
 
-        self._append_entry(entry)
+        self._append_entry(entry, now.timestamp())
 
 
 class RaySharpSensor(RaySharpEntity, SensorEntity):
@@ -1033,3 +1368,29 @@ class RaySharpSensor(RaySharpEntity, SensorEntity):
     def native_value(self) -> Any:
         """Return the sensor value."""
         return self.entity_description.value_fn(self.coordinator.data)
+
+
+class RaySharpIndexedSensor(RaySharpEntity, SensorEntity):
+    """Sensor for one field of the N-th disk or channel."""
+
+    entity_description: RaySharpIndexedSensorDescription
+
+    def __init__(
+        self,
+        coordinator: RaySharpNVRCoordinator,
+        description: RaySharpIndexedSensorDescription,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+        self.entity_description = description
+        device_data = coordinator.data.get(DATA_DEVICE_INFO, {}) or {}
+        mac = device_data.get("mac_addr", "unknown")
+        self._attr_unique_id = f"{mac}_{description.key}"
+
+    @property
+    def native_value(self) -> Any:
+        """Return the sensor value."""
+        description = self.entity_description
+        return description.indexed_value_fn(
+            self.coordinator, description.index, description.field
+        )
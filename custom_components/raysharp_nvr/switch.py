@@ -10,6 +10,7 @@ Provides switches for:
 from __future__ import annotations
 
 import logging
+import sys
 from typing import Any
 
 from homeassistant.components.switch import SwitchEntity
@@ -28,7 +29,6 @@ from .const import (
     DATA_ALARM_FD,
     DATA_ALARM_LCD,
     DATA_ALARM_PID,
-    DATA_CHANNEL_INFO,
     DATA_DEVICE_INFO,
     DATA_DISARMING,
     DATA_MOTION_ALARM,
@@ -40,46 +40,6 @@ from .entity import RaySharpChannelEntity, RaySharpEntity, channel_num_from_str
 _LOGGER = logging.getLogger(__name__)
 
 
-def _get_channel_list(data: dict[str, Any]) -> list[dict[str, Any]]:
-    """Extract channel list from coordinator data."""
-    channel_data = data.get(DATA_CHANNEL_INFO)
-    if not channel_data:
-        return []
-    if isinstance(channel_data, dict):
-        channels = channel_data.get("channel_param", {}).get("items", [])
-        if not channels:
-            channels = channel_data.get("channels", channel_data.get("channel", []))
-    elif isinstance(channel_data, list):
-        channels = channel_data
-    else:
-        return []
-    if not isinstance(channels, list):
-        channels = [channels]
-    return channels
-
-
-def _get_channel_alarm_value(
-    alarm_data: Any, channel_num: int, field: str
-) -> bool | None:
-    """Get a boolean alarm field value for a specific channel.
-
-    Alarm configs use "CH{n}" keys in channel_info dict.
-    """
-    if not isinstance(alarm_data, dict):
-        return None
-    channel_info = alarm_data.get("channel_info", {})
-    if not isinstance(channel_info, dict):
-        return None
-    ch_key = f"CH{channel_num}"
-    ch_data = channel_info.get(ch_key, {})
-    if not isinstance(ch_data, dict):
-        return None
-    value = ch_data.get(field)
-    if value is None:
-        return None
-    return bool(value)
-
-
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
@@ -88,24 +48,31 @@ async def async_setup_entry(
     """Set up RaySharp NVR switches."""
     coordinator: RaySharpNVRCoordinator = hass.data[DOMAIN][entry.entry_id]
     entities: list[SwitchEntity] = []
+    device_data = coordinator.data.get(DATA_DEVICE_INFO, {}) or {}
+    mac = sys.intern(device_data.get("mac_addr", "unknown"))
 
     # ── Global alarm disarming switch ────────────────────────────────────────
     if coordinator.data.get(DATA_DISARMING) is not None:
-        entities.append(RaySharpDisarmingSwitch(coordinator))
+        entities.append(RaySharpDisarmingSwitch(coordinator, mac))
 
     # ── Per-channel switches ─────────────────────────────────────────────────
-    channels = _get_channel_list(coordinator.data)
-    for i, channel in enumerate(channels):
+    for i, channel in enumerate(coordinator.channels):
         channel_num = channel_num_from_str(channel.get("channel", ""), i + 1)
         channel_name = channel.get("channel_name", f"Channel {channel_num}")
 
         # Motion alarm recording enable
         if coordinator.data.get(DATA_MOTION_ALARM) is not None:
             entities.append(
-                RaySharpMotionAlarmSwitch(
+                RaySharpIntelligentAlarmSwitch(
                     coordinator,
+                    mac,
                     channel_num=channel_num,
                     channel_name=channel_name,
+                    alarm_data_key=DATA_MOTION_ALARM,
+                    alarm_set_endpoint=API_MOTION_ALARM_SET,
+                    key_suffix="motion_alarm",
+                    translation_key="motion_alarm_recording",
+                    icon="mdi:motion-sensor",
                 )
             )
 
@@ -114,6 +81,7 @@ async def async_setup_entry(
             entities.append(
                 RaySharpIntelligentAlarmSwitch(
                     coordinator,
+                    mac,
                     channel_num=channel_num,
                     channel_name=channel_name,
                     alarm_data_key=DATA_ALARM_FD,
@@ -129,6 +97,7 @@ async def async_setup_entry(
             entities.append(
                 RaySharpIntelligentAlarmSwitch(
                     coordinator,
+                    mac,
                     channel_num=channel_num,
                     channel_name=channel_name,
                     alarm_data_key=DATA_ALARM_LCD,
@@ -144,6 +113,7 @@ async def async_setup_entry(
             entities.append(
                 RaySharpIntelligentAlarmSwitch(
                     coordinator,
+                    mac,
                     channel_num=channel_num,
                     channel_name=channel_name,
                     alarm_data_key=DATA_ALARM_PID,
@@ -164,15 +134,15 @@ class RaySharpDisarmingSwitch(RaySharpEntity, SwitchEntity):
     When OFF: alarms are active (default).
     """
 
+    __slots__ = ()
+
     _attr_translation_key = "alarm_disarming"
     _attr_entity_category = EntityCategory.CONFIG
     _attr_icon = "mdi:bell-off"
 
-    def __init__(self, coordinator: RaySharpNVRCoordinator) -> None:
+    def __init__(self, coordinator: RaySharpNVRCoordinator, mac: str) -> None:
         """Initialize the disarming switch."""
         super().__init__(coordinator)
-        device_data = coordinator.data.get(DATA_DEVICE_INFO, {}) or {}
-        mac = device_data.get("mac_addr", "unknown")
         self._attr_unique_id = f"{mac}_alarm_disarming"
 
     @property
@@ -207,77 +177,25 @@ class RaySharpDisarmingSwitch(RaySharpEntity, SwitchEntity):
         except RaySharpNVRConnectionError as err:
             _LOGGER.error("Failed to set alarm disarming: %s", err)
             return
-        await self.coordinator.async_request_refresh()
-
-
-class RaySharpMotionAlarmSwitch(RaySharpChannelEntity, SwitchEntity):
-    """Switch to enable/disable motion alarm recording for a channel."""
-
-    _attr_entity_category = EntityCategory.CONFIG
-    _attr_icon = "mdi:motion-sensor"
-    _attr_translation_key = "motion_alarm_recording"
-
-    def __init__(
-        self,
-        coordinator: RaySharpNVRCoordinator,
-        channel_num: int,
-        channel_name: str,
-    ) -> None:
-        """Initialize the motion alarm switch."""
-        RaySharpChannelEntity.__init__(self, coordinator, channel_num, channel_name)
-        device_data = coordinator.data.get(DATA_DEVICE_INFO, {}) or {}
-        mac = device_data.get("mac_addr", "unknown")
-        self._attr_unique_id = f"{mac}_ch{channel_num}_motion_alarm"
-
-    @property
-    def is_on(self) -> bool | None:
-        """Return True if motion alarm recording is enabled for this channel."""
-        motion_data = self.coordinator.data.get(DATA_MOTION_ALARM)
-        return _get_channel_alarm_value(motion_data, self._channel_num, "record_enable")
-
-    async def async_turn_on(self, **kwargs: Any) -> None:
-        """Enable motion alarm recording."""
-        await self._set_channel_field("record_enable", True)
-
-    async def async_turn_off(self, **kwargs: Any) -> None:
-        """Disable motion alarm recording."""
-        await self._set_channel_field("record_enable", False)
-
-    async def _set_channel_field(self, field: str, value: Any) -> None:
-        """Update a single field in this channel's motion alarm config."""
-        motion_data = self.coordinator.data.get(DATA_MOTION_ALARM)
-        if not isinstance(motion_data, dict):
-            _LOGGER.error("No motion alarm data available for channel %d", self._channel_num)
-            return
-
-        channel_info = motion_data.get("channel_info", {})
-        ch_key = f"CH{self._channel_num}"
-        ch_data = channel_info.get(ch_key, {})
-
-        if not ch_data:
-            _LOGGER.warning("Channel %s not found in motion alarm config", ch_key)
-            return
+        self.coordinator.async_set_local_data(DATA_DISARMING, payload)
+        await self.coordinator.async_request_refresh_debounced()
 
-        # Build payload with just this channel's config updated
-        updated_ch = {**ch_data, field: value}
-        payload = {"channel_info": {ch_key: updated_ch}}
 
-        try:
-            await self.coordinator.client.async_api_call(API_MOTION_ALARM_SET, payload)
-        except RaySharpNVRConnectionError as err:
-            _LOGGER.error("Failed to set motion alarm for channel %d: %s", self._channel_num, err)
-            return
-        await self.coordinator.async_request_refresh()
+class RaySharpIntelligentAlarmSwitch(RaySharpChannelEntity, SwitchEntity):
+    """Generic switch for alarm recording enable/disable per channel.
 
+    Serves motion alarms as well as the intelligent (FD/LCD/PID) alarms; each
+    instance is bound to one alarm config section and its set endpoint.
+    """
 
-class RaySharpIntelligentAlarmSwitch(RaySharpChannelEntity, SwitchEntity):
-    """Generic switch for intelligent alarm recording enable/disable per channel."""
+    __slots__ = ("_alarm_data_key", "_alarm_set_endpoint")
 
     _attr_entity_category = EntityCategory.CONFIG
 
     def __init__(
         self,
         coordinator: RaySharpNVRCoordinator,
+        mac: str,
         channel_num: int,
         channel_name: str,
         alarm_data_key: str,
@@ -290,8 +208,6 @@ class RaySharpIntelligentAlarmSwitch(RaySharpChannelEntity, SwitchEntity):
         RaySharpChannelEntity.__init__(self, coordinator, channel_num, channel_name)
         self._alarm_data_key = alarm_data_key
         self._alarm_set_endpoint = alarm_set_endpoint
-        device_data = coordinator.data.get(DATA_DEVICE_INFO, {}) or {}
-        mac = device_data.get("mac_addr", "unknown")
         self._attr_unique_id = f"{mac}_ch{channel_num}_{key_suffix}"
         self._attr_translation_key = translation_key
         self._attr_icon = icon
@@ -299,8 +215,9 @@ class RaySharpIntelligentAlarmSwitch(RaySharpChannelEntity, SwitchEntity):
     @property
     def is_on(self) -> bool | None:
         """Return True if alarm recording is enabled for this channel."""
-        alarm_data = self.coordinator.data.get(self._alarm_data_key)
-        return _get_channel_alarm_value(alarm_data, self._channel_num, "record_enable")
+        return self.coordinator.get_channel_alarm(
+            self._alarm_data_key, self._ch_key, "record_enable"
+        )
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Enable alarm recording."""
@@ -322,7 +239,7 @@ class RaySharpIntelligentAlarmSwitch(RaySharpChannelEntity, SwitchEntity):
             return
 
         channel_info = alarm_data.get("channel_info", {})
-        ch_key = f"CH{self._channel_num}"
+        ch_key = self._ch_key
         ch_data = channel_info.get(ch_key, {})
 
         if not ch_data:
@@ -346,4 +263,7 @@ class RaySharpIntelligentAlarmSwitch(RaySharpChannelEntity, SwitchEntity):
                 err,
             )
             return
-        await self.coordinator.async_request_refresh()
+        self.coordinator.async_set_local_channel_field(
+            self._alarm_data_key, ch_key, field, value
+        )
+        await self.coordinator.async_request_refresh_debounced()